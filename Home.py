@@ -1,28 +1,47 @@
 import streamlit as st
+from warmup import get_warmup, WARMUP_BUDGET
 
 st.set_page_config(
-    page_title="Hello",
-    page_icon="👋",
+    page_title="MLB Prop Model",
+    page_icon="⚾",
 )
 
-st.write("# Welcome to Streamlit! 👋")
-
-st.sidebar.success("Select a demo above.")
-
-st.markdown(
-    """
-    Streamlit is an open-source app framework built specifically for
-    Machine Learning and Data Science projects.
-    **👈 Select a demo from the sidebar** to see some examples
-    of what Streamlit can do!
-    ### Want to learn more?
-    - Check out [streamlit.io](https://streamlit.io)
-    - Jump into our [documentation](https://docs.streamlit.io)
-    - Ask a question in our [community
-        forums](https://discuss.streamlit.io)
-    ### See more complex demos
-    - Use a neural net to [analyze the Udacity Self-driving Car Image
-        Dataset](https://github.com/streamlit/demo-self-driving)
-    - Explore a [New York City rideshare dataset](https://github.com/streamlit/demo-uber-nyc-pickups)
-"""
-)
\ No newline at end of file
+# The first visit after a server restart starts the warm-up; the prop pages then open
+# on warm caches and today's snapshots instead of doing the cold work themselves
+warmup = get_warmup()
+warmup.start()
+
+st.write("# ⚾ MLB Prop Model")
+
+st.page_link("pages/1_Pitcher_Plays.py", label="Pitcher Plays", icon="🎯")
+st.page_link("pages/2_Batter_Plays.py", label="Batter Plays", icon="🏏")
+st.page_link("pages/3_Bet_Form.py", label="Bet Tracker", icon="📊")
+
+STATUS_ICONS = {'pending': '⏳', 'running': '🔄', 'done': '✅', 'failed': '❌'}
+
+
+def warmup_status():
+    state = warmup.state()
+    steps = state['steps']
+    finished = sum(step['status'] in ('done', 'failed') for step in steps)
+
+    st.markdown("### Warm-up")
+    st.progress(finished / len(steps), text=f"{finished} of {len(steps)} steps, {state['elapsed'] or 0:.1f}s")
+    for step in steps:
+        seconds = f" ({step['seconds']:.1f}s)" if step['seconds'] is not None else ""
+        error = f": {step['error']}" if step['error'] else ""
+        st.write(f"{STATUS_ICONS[step['status']]} {step['label']}{seconds}{error}")
+
+    if state['first_table'] is not None:
+        st.caption(f"First table ready {state['first_table']:.1f}s after warm-up start ({state['started_at']:%H:%M:%S})")
+    if not state['done'] and (state['elapsed'] or 0) > WARMUP_BUDGET:
+        st.warning(f"Warm-up is past its {WARMUP_BUDGET}s budget; the pages still work but will do the remaining work themselves.")
+    if state['done'] and st.session_state.get('warmup_polling'):
+        # Full rerun once, so the fragment below is rebuilt without its refresh timer
+        st.session_state['warmup_polling'] = False
+        st.rerun()
+
+
+polling = not warmup.state()['done']
+st.session_state['warmup_polling'] = polling
+st.fragment(warmup_status, run_every=1 if polling else None)()
@@ -0,0 +1,266 @@
+import os
+import sys
+import hashlib
+import inspect
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import pitcher_engine
+import batter_engine
+import pitcher_games
+import opponent_splits
+import player_index
+import bet_grader
+from pitcher_engine import evaluate_slate
+from batter_engine import evaluate_tb_rules
+from pitcher_games import build_pitcher_games
+from opponent_splits import build_opponent_splits
+from player_index import build_indexes
+from bet_grader import build_stat_lines, grade_lines
+from bet_ledger import parse_odds
+from statcast_store import data_version
+
+# Point-in-time backtest of the prop rules. Each game date is scored using only Statcast
+# rows from before that date, with the same evaluate_slate / evaluate_tb_rules the pages
+# use, and graded against that date's results. Dates run in a process pool and each
+# finished date is saved, so re-runs only compute dates not seen yet for the same rules,
+# history window and Statcast data.
+#
+#   python backtest.py 2025-04-10 2025-05-07 --history-start 2025-03-27 --workers 4
+
+RESULTS_DIR = os.path.join(os.getcwd(), "backtest_results")
+
+PITCHER_TYPES = ['Strikeouts', 'Pitching Outs', 'Hits Allowed', 'Walks Allowed']
+
+# Lines used to reconstruct props when no archived lines are given
+LINE_GRID = {
+    'Strikeouts': [3.5, 4.5, 5.5, 6.5],
+    'Pitching Outs': [14.5, 15.5, 16.5, 17.5],
+    'Hits Allowed': [3.5, 4.5, 5.5, 6.5],
+    'Walks Allowed': [0.5, 1.5, 2.5],
+    'Total Bases': [0.5, 1.5],
+}
+DEFAULT_ODDS = '-110'
+TB_LOOKBACK = 17  # games, as on the batter page
+
+# Modules whose code decides a backtest result: the rule engines, the derived tables
+# they read and the grader
+RULES_MODULES = [pitcher_engine, batter_engine, pitcher_games, opponent_splits, player_index, bet_grader]
+
+RESULT_COLUMNS = ['date', 'player_id', 'opponent', 'type', 'line', 'label', 'odds', 'rules_hit', 'actual', 'grade']
+
+
+def rules_version(lines=None):
+    # Changes whenever a rule threshold, the features or grading behind them, the line
+    # grid or the archived lines change
+    h = hashlib.sha1()
+    for module in RULES_MODULES:
+        h.update(inspect.getsource(module).encode('utf-8'))
+    h.update(repr((sorted(LINE_GRID.items()), TB_LOOKBACK, DEFAULT_ODDS)).encode('utf-8'))
+    if lines is not None:
+        h.update(pd.util.hash_pandas_object(lines, index=False).values.tobytes())
+    return h.hexdigest()[:12]
+
+
+def load_lines(path):
+    # Archived lines: one row per selection with date, player_id, type, line, label and odds
+    lines = pd.read_csv(path, dtype={'odds': str})
+    lines['date'] = pd.to_datetime(lines['date']).dt.strftime('%Y-%m-%d')
+    lines['player_id'] = lines['player_id'].astype(int)
+    return lines
+
+
+# ---------------------- Per-Date Props ----------------------
+
+def day_context(day_df):
+    # Starters (pitcher, team, opponent) and each batter's team and opposing starter for one date
+    topbot = day_df['inning_topbot'].astype(object)
+    home = day_df['home_team'].astype(object)
+    away = day_df['away_team'].astype(object)
+    rows = pd.DataFrame({
+        'game_pk': day_df['game_pk'],
+        'at_bat_number': day_df['at_bat_number'],
+        'pitch_number': day_df['pitch_number'],
+        'pitcher': day_df['pitcher'],
+        'batter': day_df['batter'],
+        'fielding': home.where(topbot == 'Top', away),
+        'batting': away.where(topbot == 'Top', home),
+    }).sort_values(['game_pk', 'at_bat_number', 'pitch_number'], kind='stable')
+
+    starters = rows.drop_duplicates(['game_pk', 'fielding'])[['game_pk', 'pitcher', 'fielding', 'batting']]
+    starters = starters.rename(columns={'fielding': 'team', 'batting': 'opponent'})
+    batters = rows.drop_duplicates(['game_pk', 'batter'])[['game_pk', 'batter', 'batting']].rename(columns={'batting': 'team'})
+    batters = batters.merge(
+        starters[['game_pk', 'opponent', 'pitcher']].rename(columns={'opponent': 'team', 'pitcher': 'opp_pid'}),
+        on=['game_pk', 'team']
+    )
+    return starters, batters
+
+
+def _grid(types):
+    return pd.DataFrame(
+        [(t, line, label) for t in types for line in LINE_GRID[t] for label in ('Over', 'Under')],
+        columns=['type', 'line', 'label']
+    ).assign(odds=DEFAULT_ODDS)
+
+
+def day_props(day, starters, batters, lines=None):
+    # (pitcher props, batter props) for one date, from archived lines or the line grid
+    if lines is None:
+        pitcher_props = starters.merge(_grid(PITCHER_TYPES), how='cross')
+        batter_props = batters.merge(_grid(['Total Bases']), how='cross')
+    else:
+        day_lines = lines[lines['date'] == day][['player_id', 'type', 'line', 'label', 'odds']]
+        pitcher_props = starters.merge(day_lines[day_lines['type'].isin(PITCHER_TYPES)], left_on='pitcher', right_on='player_id')
+        batter_props = batters.merge(day_lines[day_lines['type'] == 'Total Bases'], left_on='batter', right_on='player_id')
+    return pitcher_props.drop_duplicates(['pitcher', 'type', 'line', 'label']), batter_props.drop_duplicates(['batter', 'type', 'line', 'label'])
+
+
+# ---------------------- Workers ----------------------
+
+_state = {}
+
+
+def _init_worker(df, lines):
+    # Runs once per process: the season frame and everything derived from it stay resident
+    _state['df'] = df
+    _state['lines'] = lines
+    _state['pitcher_games'] = build_pitcher_games(df)
+    _state['stat_lines'] = build_stat_lines(df, _state['pitcher_games'])
+    _state['indexes'] = build_indexes(df)
+
+
+def _score_pitchers(props, day_ts):
+    if props.empty:
+        return pd.DataFrame(columns=['player_id', 'opponent', 'type', 'line', 'label', 'odds', 'rules_hit'])
+    df = _state['df']
+    games = _state['pitcher_games']
+    opp_splits = build_opponent_splits(df[df['game_date'] < day_ts])
+    slate = props.assign(pitcher_name=props['pitcher'].astype(str), pitcher_id=props['pitcher'])
+    results = evaluate_slate(slate, games[games['game_date'] < day_ts], opp_splits)
+    return pd.DataFrame({
+        'player_id': results['Pitcher'].astype(int),
+        'opponent': results['Opponent'],
+        'type': results['Prop'],
+        'line': results['Line'],
+        'label': results['Direction'],
+        'odds': results['Odds'],
+        'rules_hit': results['Rules Hit'],
+    })
+
+
+def _history(index, player_id, day_ts):
+    rows = index.get(player_id)
+    return rows[rows['game_date'] < day_ts].copy()
+
+
+def _score_batters(props, day_ts):
+    scored = []
+    for (bid, opp_pid), group in props.groupby(['batter', 'opp_pid'], sort=False):
+        batter_df = _history(_state['indexes']['batter'], bid, day_ts)
+        pitcher_df = _history(_state['indexes']['pitcher'], opp_pid, day_ts)
+        if batter_df.empty or pitcher_df.empty:
+            continue
+        for row in group.itertuples():
+            result = evaluate_tb_rules(batter_df, pitcher_df, pitcher_df['p_throws'].iloc[0], batter_df['stand'].iloc[0], row.line, TB_LOOKBACK, row.label.lower())
+            if not result:
+                continue
+            scored.append({
+                'player_id': bid, 'opponent': str(opp_pid), 'type': row.type, 'line': row.line,
+                'label': row.label, 'odds': row.odds, 'rules_hit': result['score'],
+            })
+    return pd.DataFrame(scored, columns=['player_id', 'opponent', 'type', 'line', 'label', 'odds', 'rules_hit'])
+
+
+def _backtest_day(day):
+    df = _state['df']
+    day_ts = pd.Timestamp(day)
+    starters, batters = day_context(df[df['game_date'] == day_ts])
+    pitcher_props, batter_props = day_props(day, starters, batters, _state['lines'])
+
+    scored = pd.concat([_score_pitchers(pitcher_props, day_ts), _score_batters(batter_props, day_ts)], ignore_index=True)
+    scored['date'] = day
+    scored['player_id'] = scored['player_id'].astype(int)
+    graded = grade_lines(scored.assign(prop_type=scored['type'], direction=scored['label']), _state['stat_lines'])
+    return graded[RESULT_COLUMNS]
+
+
+# ---------------------- Runner ----------------------
+
+def run_backtest(df, start, end, lines=None, workers=None, force=False):
+    # Scores every game date in [start, end] not already saved for the current rules version,
+    # history start and Statcast data, so a different --history-start or corrected days rescore
+    history_start = str(pd.to_datetime(df['game_date']).min())[:10]
+    run_dir = os.path.join(RESULTS_DIR, f"{rules_version(lines)}_{history_start}_{data_version(df)}")
+    os.makedirs(run_dir, exist_ok=True)
+
+    game_dates = pd.to_datetime(df['game_date']).dt.strftime('%Y-%m-%d')
+    days = sorted(d for d in game_dates.unique() if start <= d <= end)
+    todo = [d for d in days if force or not os.path.exists(os.path.join(run_dir, f"{d}.parquet"))]
+    print(f"Backtest {start} to {end}: {len(days)} dates, {len(todo)} to score, results in {run_dir}")
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(df, lines)) as pool:
+            for day, frame in zip(todo, pool.map(_backtest_day, todo)):
+                frame.to_parquet(os.path.join(run_dir, f"{day}.parquet"), index=False)
+                print(f"  {day}: {len(frame)} props, {frame['grade'].notna().sum()} graded")
+
+    frames = [pd.read_parquet(os.path.join(run_dir, f"{d}.parquet")) for d in days]
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize(results, by=('type', 'rules_hit')):
+    # Win rate and flat-stake ROI (1 unit per prop) for each group of graded props
+    graded = results[results['grade'].notna()]
+    decimal = graded['odds'].map(lambda odds: parse_odds(odds)[1])
+    units = np.select(
+        [graded['grade'] == 'W', graded['grade'] == 'L'],
+        [decimal.fillna(1) - 1, -1.0],
+        default=0.0
+    )
+    summary = graded.assign(
+        wins=graded['grade'] == 'W',
+        losses=graded['grade'] == 'L',
+        pushes=graded['grade'] == 'P',
+        units=units,
+    ).groupby(list(by)).agg(
+        props=('grade', 'size'),
+        wins=('wins', 'sum'),
+        losses=('losses', 'sum'),
+        pushes=('pushes', 'sum'),
+        units=('units', 'sum'),
+    )
+    summary['win_rate'] = summary['wins'] / (summary['wins'] + summary['losses']).where(lambda n: n > 0)
+    summary['roi'] = summary['units'] / summary['props']
+    return summary.reset_index()
+
+
+def main(argv=None):
+    from statcast_store import load_statcast
+
+    parser = argparse.ArgumentParser(description="Point-in-time backtest of the prop rules")
+    parser.add_argument('start', help="first date to score (YYYY-MM-DD)")
+    parser.add_argument('end', help="last date to score (YYYY-MM-DD)")
+    parser.add_argument('--history-start', help="first Statcast date used as history (default: start)")
+    parser.add_argument('--lines', help="CSV of archived lines (date, player_id, type, line, label, odds)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="rescore dates that already have results")
+    args = parser.parse_args(argv)
+
+    df = load_statcast(args.history_start or args.start, args.end)
+    lines = load_lines(args.lines) if args.lines else None
+    results = run_backtest(df, args.start, args.end, lines=lines, workers=args.workers, force=args.force)
+
+    summary = summarize(results)
+    recommended = summarize(results[results['rules_hit'] >= 4], by=('type',))
+    pd.set_option('display.width', 200)
+    print(summary.to_string(index=False))
+    print("\nRecommended (4+ rules hit):")
+    print(recommended.to_string(index=False))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
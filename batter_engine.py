@@ -0,0 +1,95 @@
+# Five-rule Total Bases evaluation for one batter against the opposing starter. Lives
+# outside the page so the backtester can score historical props with the same rules.
+
+
+def evaluate_tb_rules(batter_df, pitcher_df, pitcher_hand='R', batter_hand='L', tb_prop_line=1.5, lookback_games=15, direction='over'):
+    # Assign Total Bases based on event
+    def calculate_total_bases(events):
+        return {
+            'single': 1, 'double': 2,
+            'triple': 3, 'home_run': 4
+        }.get(events, 0)
+
+    try:
+
+        batter_df['TB'] = batter_df['events'].apply(calculate_total_bases)
+
+        # Aggregate TB to game level
+        game_tb = (
+            batter_df.groupby(['game_date'])['TB']
+            .sum()
+            .reset_index()
+            .sort_values('game_date', ascending=False)
+        )
+
+        recent_games = game_tb.head(lookback_games)
+        if len(recent_games) < 10:
+            return None
+        recent_tb = recent_games['TB']
+
+        ## Rule 1: Hit Rate Over Line
+        hit_rate = (recent_tb > tb_prop_line).mean()
+        rule_1 = hit_rate >= 0.65 if direction == 'over' else hit_rate <= 0.35
+
+        ## Rule 2: Rolling Avg TB
+        rolling_avg = recent_tb.mean()
+        rule_2 = rolling_avg >= (tb_prop_line + 0.25) if direction == 'over' else rolling_avg <= (tb_prop_line - 0.25)
+
+        ## Rule 3: TB vs Pitcher Handedness
+        split_df = batter_df[batter_df['p_throws'] == pitcher_hand]
+        split_game_tb = split_df.groupby('game_date')['TB'].sum()
+        split_tb_avg = split_game_tb.mean()
+        rule_3 = split_tb_avg >= (tb_prop_line + 0.25) if direction == 'over' else split_tb_avg <= (tb_prop_line - 0.25)
+
+        ## Rule 4: xSLG or ISO
+        batted_ball_events = split_df[split_df['bb_type'].notnull()]
+        batted_ball_events['iso'] = batted_ball_events['estimated_slg_using_speedangle'] - batted_ball_events['estimated_ba_using_speedangle']
+        avg_xslg = batted_ball_events['estimated_slg_using_speedangle'].mean()
+        avg_iso = batted_ball_events['iso'].mean()
+        rule_4 = (
+            avg_xslg >= 0.450 or avg_iso >= 0.180
+        ) if direction == 'over' else (
+            avg_xslg <= 0.350 and avg_iso <= 0.120
+        )
+
+        ## Rule 5: Pitcher Weakness vs Batter Handedness
+        pitcher_split = pitcher_df[pitcher_df['stand'] == batter_hand]
+
+        # TB allowed by pitcher: calculate from events
+        pitcher_split['TB_allowed'] = pitcher_split['events'].apply(calculate_total_bases)
+
+        # xSLG allowed estimate (mean over all BIP events)
+        xslg_allowed = pitcher_split[pitcher_split['bb_type'].notnull()]['estimated_slg_using_speedangle'].mean()
+        tb_per_pa = pitcher_split.groupby(['game_date', 'batter'])['TB_allowed'].sum().mean()
+
+        rule_5 = (
+            xslg_allowed >= 0.450 or tb_per_pa >= 1.0
+        ) if direction == 'over' else (
+            xslg_allowed <= 0.350 and tb_per_pa <= 0.7
+        )
+        # Compile rule results
+        rule_results = {
+            'rule_1_hit_rate': rule_1,
+            'rule_2_rolling_avg_tb': rule_2,
+            'rule_3_vs_hand_split': rule_3,
+            'rule_4_xslg_or_iso': rule_4,
+            'rule_5_pitcher_weakness': rule_5
+        }
+
+        rules = {
+            'hit_rate': hit_rate,
+            'rolling_avg_tb': rolling_avg,
+            'vs_hand_split': split_game_tb.mean(),
+            'avg_xslg': batted_ball_events['estimated_slg_using_speedangle'].mean(),
+            'avg_iso': batted_ball_events['iso'].mean(),
+            'pitcher_xslg_allowed': xslg_allowed,
+            'pitcher_tb_allowed_per_pa': tb_per_pa
+        }
+
+        score = sum(rule_results.values())
+        rules['score'] = score
+        rules['recommend'] = score >= 4
+
+        return rules
+    except:
+        return None
@@ -0,0 +1,155 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from synthetic_statcast import make_statcast
+from pitcher_games import build_pitcher_games
+from opponent_splits import build_opponent_splits
+from player_index import build_indexes
+from pitcher_engine import evaluate_slate
+from batter_engine import evaluate_tb_rules
+from backtest import day_context, day_props
+
+# Offline benchmarks for the derived tables, the evaluators and the full slate loops on
+# synthetic season-to-date frames. Each case reports the best and median wall time over
+# a few repeats plus peak traced memory from one extra run, and the whole run is written
+# as JSON so it can be compared against an earlier one:
+#
+#   python benchmark.py --days 30 90 180 --compare benchmark_results/<earlier>.json
+
+RESULTS_DIR = os.path.join(os.getcwd(), "benchmark_results")
+TB_LOOKBACK = 17
+
+
+def measure(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    # Separate traced run: tracemalloc slows allocation-heavy code, so it is not timed
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'best_s': min(times), 'median_s': float(np.median(times)), 'peak_mb': peak / 1024 ** 2}
+
+
+def _slate(df):
+    # The last day's games play the role of today's slate; everything before it is history
+    last_day = df['game_date'].max()
+    history = df[df['game_date'] < last_day]
+    starters, batters = day_context(df[df['game_date'] == last_day])
+    pitcher_props, batter_props = day_props(last_day.strftime('%Y-%m-%d'), starters, batters)
+    pitcher_props = pitcher_props.assign(pitcher_name=pitcher_props['pitcher'].astype(str), pitcher_id=pitcher_props['pitcher'])
+    return history, pitcher_props, batter_props
+
+
+def batter_slate(props, indexes):
+    # Same per-prop loop as the batter page
+    evaluated = 0
+    for row in props.itertuples():
+        batter_df = indexes['batter'].get(row.batter)
+        if batter_df.empty: continue
+        pitcher_df = indexes['pitcher'].get(row.opp_pid)
+        if pitcher_df.empty: continue
+        result = evaluate_tb_rules(batter_df, pitcher_df, pitcher_df['p_throws'].iloc[0], batter_df['stand'].iloc[0], row.line, TB_LOOKBACK, row.label.lower())
+        evaluated += result is not None
+    return evaluated
+
+
+def run_size(days, teams, batter_props, repeat, seed):
+    df = make_statcast(days=days, teams=teams, seed=seed)
+    history, pitcher_props, tb_props = _slate(df)
+    tb_props = tb_props.head(batter_props)
+
+    games = build_pitcher_games(history)
+    opp_splits = build_opponent_splits(history)
+    indexes = build_indexes(history)
+    first = tb_props.iloc[0]
+    batter_df = indexes['batter'].get(first['batter'])
+    pitcher_df = indexes['pitcher'].get(first['opp_pid'])
+
+    cases = {
+        'build_pitcher_games': lambda: build_pitcher_games(history),
+        'build_opponent_splits': lambda: build_opponent_splits(history),
+        'build_indexes': lambda: build_indexes(history),
+        'evaluate_slate': lambda: evaluate_slate(pitcher_props, games, opp_splits),
+        'evaluate_tb_rules': lambda: evaluate_tb_rules(batter_df.copy(), pitcher_df.copy(), pitcher_df['p_throws'].iloc[0], batter_df['stand'].iloc[0], first['line'], TB_LOOKBACK, first['label'].lower()),
+        'pitcher_slate_full': lambda: evaluate_slate(pitcher_props, build_pitcher_games(history), build_opponent_splits(history)),
+        'batter_slate_loop': lambda: batter_slate(tb_props, indexes),
+    }
+    results = {}
+    for name, fn in cases.items():
+        results[name] = measure(fn, repeat)
+        print(f"  {name:<24} best {results[name]['best_s'] * 1000:9.1f} ms   peak {results[name]['peak_mb']:8.1f} MB")
+
+    return {
+        'days': days,
+        'rows': len(history),
+        'pitcher_props': len(pitcher_props),
+        'batter_props': len(tb_props),
+        'cases': results,
+    }
+
+
+def compare(current, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(size['days'], name): case for size in baseline['sizes'] for name, case in size['cases'].items()}
+    print(f"\nCompared with {baseline_path} (best time ratio, >1 is slower):")
+    for size in current['sizes']:
+        for name, case in size['cases'].items():
+            before = previous.get((size['days'], name))
+            if before is None:
+                continue
+            ratio = case['best_s'] / before['best_s'] if before['best_s'] else float('nan')
+            flag = '  <-- regression' if ratio > 1.2 else ''
+            print(f"  {size['days']:>4}d {name:<24} {ratio:6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks on synthetic Statcast frames")
+    parser.add_argument('--days', type=int, nargs='+', default=[30, 90, 180], help="season lengths to benchmark")
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--batter-props', type=int, default=100, help="props in the batter slate loop")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="results file (default: benchmark_results/<timestamp>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    run = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.platform(),
+        'config': vars(args),
+        'sizes': [],
+    }
+    for days in args.days:
+        print(f"{days} days:")
+        run['sizes'].append(run_size(days, args.teams, args.batter_props, args.repeat, args.seed))
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(run, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(run, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import pandas as pd
+from bet_ledger import connect, get_aggregates
+
+# P&L views over the bet ledger. The headline numbers come from the running totals the
+# ledger maintains on every grade; ad-hoc cuts are columnar groupbys over the numeric
+# odds/profit columns, so no odds string is parsed after a bet is entered.
+
+DIMENSION_LABELS = {
+    'prop_type': 'Prop Type',
+    'direction': 'Direction',
+    'player': 'Player',
+    'month': 'Month',
+}
+SUMMARY_COLUMNS = ['bets', 'wins', 'losses', 'pushes', 'staked', 'profit', 'units', 'roi', 'win_rate']
+
+
+def _add_rates(frame):
+    frame['roi'] = frame['profit'] / frame['staked'].where(frame['staked'] > 0)
+    decided = frame['wins'] + frame['losses']
+    frame['win_rate'] = frame['wins'] / decided.where(decided > 0)
+    return frame
+
+
+def summary():
+    # Totals across every graded bet, read straight from the running aggregates
+    rows = get_aggregates('all')
+    totals = rows[0] if rows else {column: 0 for column in SUMMARY_COLUMNS}
+    return _add_rates(pd.DataFrame([totals])).iloc[0][SUMMARY_COLUMNS].to_dict()
+
+
+def aggregate_frame(dimension):
+    # One row per bucket of a maintained dimension (prop_type, direction, player, month)
+    frame = pd.DataFrame(get_aggregates(dimension), columns=['dimension', 'bucket'] + SUMMARY_COLUMNS[:7])
+    frame = _add_rates(frame).drop(columns='dimension').rename(columns={'bucket': DIMENSION_LABELS.get(dimension, dimension)})
+    return frame.sort_values('profit', ascending=False).reset_index(drop=True)
+
+
+def graded_frame():
+    conn = connect()
+    try:
+        frame = pd.read_sql_query(
+            "SELECT id, date, player, prop_type, direction, line, stake, grade, "
+            "american_odds, decimal_odds, implied_prob, profit, units "
+            "FROM bets WHERE grade IS NOT NULL",
+            conn
+        )
+    finally:
+        conn.close()
+    frame['month'] = frame['date'].str[:7]
+    return frame
+
+
+def breakdown(frame, by):
+    # Columnar P&L breakdown of a graded frame by any column(s), e.g. ['prop_type', 'direction']
+    frame = frame.assign(
+        wins=frame['grade'].eq('W'),
+        losses=frame['grade'].eq('L'),
+        pushes=frame['grade'].eq('P'),
+    )
+    grouped = frame.groupby(by, sort=False).agg(
+        bets=('grade', 'size'),
+        wins=('wins', 'sum'),
+        losses=('losses', 'sum'),
+        pushes=('pushes', 'sum'),
+        staked=('stake', 'sum'),
+        profit=('profit', 'sum'),
+        units=('units', 'sum'),
+        avg_implied_prob=('implied_prob', 'mean'),
+    ).reset_index()
+    return _add_rates(grouped).sort_values('profit', ascending=False).reset_index(drop=True)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from bet_ledger import get_bets, grade_bets
+from pitcher_games import build_pitcher_games
+from player_resolver import resolve_many
+
+# Auto-grading of ungraded bets from Statcast. Every bet is joined against a
+# per-player-per-date stat line and graded W/L/P in one vectorized pass; the grades
+# are then written in a single ledger transaction.
+
+TB_MAP = {'single': 1, 'double': 2, 'triple': 3, 'home_run': 4}
+
+# prop_type -> (role, stat line column)
+PROP_STATS = {
+    'Strikeouts': ('pitcher', 'strikeouts'),
+    'Pitching Outs': ('pitcher', 'outs'),
+    'Hits Allowed': ('pitcher', 'hits'),
+    'Walks Allowed': ('pitcher', 'walks'),
+    'Total Bases': ('batter', 'total_bases'),
+}
+
+
+def build_stat_lines(df, pitcher_games=None):
+    # Long frame: one row per (role, player_id, date, stat) with the day's total
+    if pitcher_games is None:
+        pitcher_games = build_pitcher_games(df)
+    pitcher_lines = (
+        pitcher_games.assign(date=pd.to_datetime(pitcher_games['game_date']).dt.strftime('%Y-%m-%d'))
+        .groupby(['pitcher', 'date'])[['strikeouts', 'outs', 'hits', 'walks']].sum()
+        .rename_axis(['player_id', 'date']).reset_index()
+        .melt(id_vars=['player_id', 'date'], var_name='stat', value_name='actual')
+        .assign(role='pitcher')
+    )
+
+    batter_lines = (
+        pd.DataFrame({
+            'player_id': df['batter'],
+            'date': pd.to_datetime(df['game_date']).dt.strftime('%Y-%m-%d'),
+            'actual': df['events'].astype(object).map(TB_MAP).fillna(0),
+        })
+        .groupby(['player_id', 'date'])['actual'].sum().reset_index()
+        .assign(stat='total_bases', role='batter')
+    )
+    return pd.concat([pitcher_lines, batter_lines], ignore_index=True)
+
+
+def grade_lines(bets, stat_lines):
+    # bets needs player_id, date, prop_type, line, direction. Rows without a stat line
+    # (unknown prop, unresolved player, player did not play) come back with grade None.
+    prop_stats = bets['prop_type'].map(PROP_STATS)
+    bets = bets.assign(role=prop_stats.str[0], stat=prop_stats.str[1])
+    graded = bets.merge(stat_lines, on=['player_id', 'date', 'role', 'stat'], how='left')
+    diff = graded['actual'] - graded['line']
+    diff = diff.where(graded['direction'].str.lower() == 'over', -diff)
+    graded['grade'] = np.select([diff > 0, diff < 0, diff == 0], ['W', 'L', 'P'], default=None)
+    return graded
+
+
+def grade_frame(bets, stat_lines):
+    # Ledger bets (id, date, player, prop_type, line, direction), resolved by name first
+    ids = resolve_many(bets['player'].unique())
+    return grade_lines(bets.assign(player_id=bets['player'].map(ids)), stat_lines)
+
+
+def auto_grade(df, pitcher_games=None):
+    # Grades every ungraded bet it can and commits them together; returns the graded rows
+    ungraded = pd.DataFrame(get_bets(graded=False))
+    if ungraded.empty:
+        return ungraded
+    graded = grade_frame(ungraded, build_stat_lines(df, pitcher_games))
+    graded = graded[graded['grade'].notna()]
+    grade_bets(dict(zip(graded['id'].astype(int), graded['grade'])))
+    return graded
@@ -0,0 +1,355 @@
+import os
+import pickle
+import sqlite3
+import threading
+from datetime import datetime
+
+# Append-only bet ledger in SQLite (WAL mode). Adding a bet is one INSERT and grading
+# one UPDATE, so no interaction has to read or rewrite the whole history, and
+# concurrent sessions no longer overwrite each other's bets.
+
+DB_PATH = os.path.join(os.getcwd(), "bets.db")
+PICKLE_PATH = os.path.join(os.getcwd(), "bets.pkl")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    player TEXT NOT NULL,
+    prop_type TEXT NOT NULL,
+    line REAL,
+    direction TEXT,
+    odds TEXT,
+    stake REAL,
+    grade TEXT,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_bets_date ON bets(date);
+CREATE INDEX IF NOT EXISTS idx_bets_player ON bets(player);
+CREATE INDEX IF NOT EXISTS idx_bets_prop_type ON bets(prop_type);
+CREATE INDEX IF NOT EXISTS idx_bets_grade ON bets(grade);
+CREATE TABLE IF NOT EXISTS migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TEXT
+);
+CREATE TABLE IF NOT EXISTS bet_aggregates (
+    dimension TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    bets INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    pushes INTEGER NOT NULL DEFAULT 0,
+    staked REAL NOT NULL DEFAULT 0,
+    profit REAL NOT NULL DEFAULT 0,
+    units REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, bucket)
+);
+"""
+
+# Numeric columns filled in at insert (odds) and at grading (profit/units), so analytics
+# never have to parse odds strings. Added with ALTER TABLE for ledgers created before them.
+NUMERIC_COLUMNS = {
+    'american_odds': 'INTEGER',
+    'decimal_odds': 'REAL',
+    'implied_prob': 'REAL',
+    'profit': 'REAL',
+    'units': 'REAL',
+}
+
+# Running totals are kept per bucket of each of these dimensions; 'all' has one bucket
+AGGREGATE_DIMENSIONS = ['all', 'prop_type', 'direction', 'player', 'month']
+
+_init_lock = threading.Lock()
+_initialized = set()
+
+
+def connect(db_path=None):
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    with _init_lock:
+        if db_path not in _initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            _add_numeric_columns(conn)
+            _migrate_pickle(conn)
+            _run_once(conn, 'bet_aggregates', rebuild_aggregates)
+            _run_once(conn, 'unicode_minus_odds', _reparse_odds)
+            _initialized.add(db_path)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _run_once(conn, name, migration):
+    # The check runs after BEGIN IMMEDIATE has taken the write lock, so when the page, the
+    # grader and precompute open a fresh ledger together only one of them migrates it
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        if conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone():
+            return False
+        migration(conn)
+        conn.execute("INSERT INTO migrations (name, applied_at) VALUES (?, ?)", (name, datetime.now().isoformat()))
+    return True
+
+
+def _migrate_pickle(conn, pickle_path=None):
+    # One-time import of the old bets.pkl; the pickle file itself is left untouched
+    pickle_path = pickle_path or PICKLE_PATH
+    bets = []
+
+    def migrate(conn):
+        if os.path.exists(pickle_path) and os.path.getsize(pickle_path) > 0:
+            with open(pickle_path, "rb") as f:
+                data = pickle.load(f)
+            bets.extend(data.get('graded_bets', []) + data.get('ungraded_bets', []))
+        for bet in bets:
+            _insert(conn, bet)
+
+    if _run_once(conn, 'bets_pkl', migrate) and bets:
+        print(f"Migrated {len(bets)} bets from {pickle_path}")
+
+
+def _add_numeric_columns(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        existing = {row['name'] for row in conn.execute("PRAGMA table_info(bets)")}
+        missing = [name for name in NUMERIC_COLUMNS if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            conn.execute(f"ALTER TABLE bets ADD COLUMN {name} {NUMERIC_COLUMNS[name]}")
+        rows = conn.execute("SELECT id, odds, stake, grade FROM bets").fetchall()
+        for row in rows:
+            american, decimal, implied = parse_odds(row['odds'])
+            profit, units = bet_result(row['stake'], decimal, row['grade'])
+            conn.execute(
+                "UPDATE bets SET american_odds = ?, decimal_odds = ?, implied_prob = ?, profit = ?, units = ? WHERE id = ?",
+                (american, decimal, implied, profit, units, row['id'])
+            )
+
+
+def _reparse_odds(conn):
+    # Bets stored with unicode-minus odds were left without numeric odds (and won for 0);
+    # parse them again and rebuild the totals they feed
+    rows = conn.execute("SELECT id, odds, stake, grade FROM bets WHERE american_odds IS NULL AND odds IS NOT NULL").fetchall()
+    for row in rows:
+        american, decimal, implied = parse_odds(row['odds'])
+        if american is None:
+            continue
+        profit, units = bet_result(row['stake'], decimal, row['grade'])
+        conn.execute(
+            "UPDATE bets SET american_odds = ?, decimal_odds = ?, implied_prob = ?, profit = ?, units = ? WHERE id = ?",
+            (american, decimal, implied, profit, units, row['id'])
+        )
+    rebuild_aggregates(conn)
+
+
+# ---------------------- Odds & Results ----------------------
+
+def parse_odds(odds):
+    # "+130" -> (130, 2.3, 0.4348), "-110" -> (-110, 1.909, 0.5238); unparseable -> Nones.
+    # Odds pasted from sportsbook pages often carry a unicode minus (U+2212)
+    try:
+        american = int(str(odds).strip().replace('−', '-').replace('+', ''))
+    except (TypeError, ValueError):
+        return None, None, None
+    if abs(american) < 100:
+        return None, None, None
+    if american > 0:
+        decimal = 1 + american / 100
+    else:
+        decimal = 1 + 100 / abs(american)
+    return american, decimal, 1 / decimal
+
+
+def bet_result(stake, decimal_odds, grade):
+    # (profit in dollars, result in units of the bet's own stake); None while ungraded
+    if grade == 'W':
+        if decimal_odds is None:
+            return 0.0, 0.0  # invalid odds count as no profit, as the tracker always has
+        return stake * (decimal_odds - 1), decimal_odds - 1
+    if grade == 'L':
+        return -stake, -1.0
+    if grade == 'P':
+        return 0.0, 0.0
+    return None, None
+
+
+def _buckets(row):
+    return [
+        ('all', 'all'),
+        ('prop_type', row['prop_type']),
+        ('direction', row['direction']),
+        ('player', row['player']),
+        ('month', row['date'][:7]),
+    ]
+
+
+def _apply_aggregates(conn, row, grade, profit, units, sign):
+    # Adds (sign=1) or removes (sign=-1) one graded bet from every running total it belongs to
+    if grade is None:
+        return
+    values = (sign, sign * (grade == 'W'), sign * (grade == 'L'), sign * (grade == 'P'),
+              sign * row['stake'], sign * profit, sign * units)
+    conn.executemany(
+        "INSERT INTO bet_aggregates (dimension, bucket, bets, wins, losses, pushes, staked, profit, units) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (dimension, bucket) DO UPDATE SET "
+        "bets = bets + excluded.bets, wins = wins + excluded.wins, losses = losses + excluded.losses, "
+        "pushes = pushes + excluded.pushes, staked = staked + excluded.staked, "
+        "profit = profit + excluded.profit, units = units + excluded.units",
+        [bucket + values for bucket in _buckets(row)]
+    )
+
+
+def rebuild_aggregates(conn):
+    # Recomputes every running total from the graded bets; incremental updates keep them current after this
+    conn.execute("DELETE FROM bet_aggregates")
+    bucket_sql = {
+        'all': "'all'",
+        'prop_type': 'prop_type',
+        'direction': 'direction',
+        'player': 'player',
+        'month': 'substr(date, 1, 7)',
+    }
+    for dimension in AGGREGATE_DIMENSIONS:
+        conn.execute(
+            "INSERT INTO bet_aggregates (dimension, bucket, bets, wins, losses, pushes, staked, profit, units) "
+            f"SELECT ?, {bucket_sql[dimension]}, COUNT(*), SUM(grade = 'W'), SUM(grade = 'L'), SUM(grade = 'P'), "
+            "SUM(stake), SUM(profit), SUM(units) FROM bets WHERE grade IS NOT NULL "
+            f"GROUP BY {bucket_sql[dimension]}",
+            (dimension,)
+        )
+
+
+# ---------------------- Ledger Operations ----------------------
+
+def _insert(conn, bet):
+    american, decimal, implied = parse_odds(bet['odds'])
+    grade = bet.get('grade') or None
+    profit, units = bet_result(bet['stake'], decimal, grade)
+    cur = conn.execute(
+        "INSERT INTO bets (date, player, prop_type, line, direction, odds, stake, grade, timestamp, "
+        "american_odds, decimal_odds, implied_prob, profit, units) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (bet['date'], bet['player'], bet['prop_type'], bet['line'], bet['direction'],
+         bet['odds'], bet['stake'], grade, bet.get('timestamp') or datetime.now().isoformat(),
+         american, decimal, implied, profit, units)
+    )
+    _apply_aggregates(conn, bet, grade, profit, units, 1)
+    return cur.lastrowid
+
+
+def add_bet(bet):
+    conn = connect()
+    try:
+        with conn:
+            return _insert(conn, bet)
+    finally:
+        conn.close()
+
+
+def _grade(conn, bet_id, grade):
+    row = conn.execute("SELECT * FROM bets WHERE id = ?", (bet_id,)).fetchone()
+    if row is None:
+        return
+    grade = grade or None
+    profit, units = bet_result(row['stake'], row['decimal_odds'], grade)
+    conn.execute("UPDATE bets SET grade = ?, profit = ?, units = ? WHERE id = ?", (grade, profit, units, bet_id))
+    # Regrading backs the old result out of the totals before adding the new one
+    _apply_aggregates(conn, row, row['grade'], row['profit'], row['units'], -1)
+    _apply_aggregates(conn, row, grade, profit, units, 1)
+
+
+def grade_bet(bet_id, grade):
+    conn = connect()
+    try:
+        with conn:
+            _grade(conn, bet_id, grade)
+    finally:
+        conn.close()
+
+
+def get_bets(graded=None):
+    # graded=None returns everything in entry order, True only graded bets (newest date
+    # first, as the history shows them), False only ungraded ones in entry order
+    query = "SELECT * FROM bets"
+    if graded is True:
+        query += " WHERE grade IS NOT NULL ORDER BY date DESC, id DESC"
+    elif graded is False:
+        query += " WHERE grade IS NULL ORDER BY id"
+    else:
+        query += " ORDER BY id"
+    conn = connect()
+    try:
+        return [dict(row) for row in conn.execute(query)]
+    finally:
+        conn.close()
+
+
+def grade_bets(grades):
+    # {bet_id: grade} applied in a single transaction
+    conn = connect()
+    try:
+        with conn:
+            for bet_id, grade in grades.items():
+                _grade(conn, bet_id, grade)
+    finally:
+        conn.close()
+
+
+def query_bets(graded=True, start=None, end=None, player=None, prop_type=None, grades=None, limit=50, offset=0):
+    # One page of bets matching the filters, newest first, plus the total match count
+    clauses = ["grade IS NOT NULL" if graded else "grade IS NULL"]
+    params = []
+    if start is not None:
+        clauses.append("date >= ?")
+        params.append(str(start))
+    if end is not None:
+        clauses.append("date <= ?")
+        params.append(str(end))
+    if player:
+        clauses.append("player = ?")
+        params.append(player)
+    if prop_type:
+        clauses.append("prop_type = ?")
+        params.append(prop_type)
+    if grades:
+        clauses.append(f"grade IN ({', '.join('?' for _ in grades)})")
+        params.extend(grades)
+    where = " WHERE " + " AND ".join(clauses)
+
+    conn = connect()
+    try:
+        total = conn.execute("SELECT COUNT(*) FROM bets" + where, params).fetchone()[0]
+        rows = conn.execute(
+            "SELECT * FROM bets" + where + " ORDER BY date DESC, id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        return [dict(row) for row in rows], total
+    finally:
+        conn.close()
+
+
+def distinct_values(column):
+    # Filter options for the history view; only indexed text columns are allowed
+    if column not in ('player', 'prop_type'):
+        raise ValueError(f"Unsupported column: {column}")
+    conn = connect()
+    try:
+        return [row[0] for row in conn.execute(f"SELECT DISTINCT {column} FROM bets ORDER BY {column}")]
+    finally:
+        conn.close()
+
+
+def get_aggregates(dimension=None):
+    query = "SELECT * FROM bet_aggregates"
+    params = ()
+    if dimension is not None:
+        query += " WHERE dimension = ?"
+        params = (dimension,)
+    conn = connect()
+    try:
+        return [dict(row) for row in conn.execute(query, params)]
+    finally:
+        conn.close()
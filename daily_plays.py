@@ -0,0 +1,165 @@
+import pandas as pd
+from statcast_store import load_statcast, data_version
+from player_resolver import resolve_player_id
+from player_profiles import profile_frame
+from data_cache import cache, HOUR
+from opponent_splits import build_opponent_splits
+from pitcher_games import build_pitcher_games
+from player_index import build_indexes
+from pitcher_engine import evaluate_slate, RESULT_COLUMNS
+from batter_engine import evaluate_tb_rules
+from draftkings_odds import pitcher_lines_today, batter_lines_today
+from eval_memo import memo, memo_key, is_missing
+from instrumentation import span, count
+
+# The pitcher and batter pipelines behind the prop pages: today's odds, the season's
+# Statcast and derived tables, then rule evaluation into the final_df tables. Nothing
+# here touches Streamlit, so the precompute job runs the exact same code headlessly.
+
+SEASON_START = '2025-03-27'
+SEASON_END = '2025-05-07'
+TB_LOOKBACK = 17
+
+
+def season_statcast():
+    return cache.get_or_load(('statcast', SEASON_START, SEASON_END), lambda: load_statcast(SEASON_START, SEASON_END), ttl=6 * HOUR)
+
+
+# ---------------------- Pitcher Plays ----------------------
+
+def pitcher_tables(statcast_df):
+    with span('opponent_splits'):
+        opp_splits = cache.get_or_load(('opponent_splits', data_version(statcast_df)), lambda: build_opponent_splits(statcast_df), ttl=6 * HOUR)
+    with span('pitcher_games'):
+        pitcher_games = cache.get_or_load(('pitcher_games', data_version(statcast_df)), lambda: build_pitcher_games(statcast_df), ttl=6 * HOUR)
+    return opp_splits, pitcher_games
+
+
+def evaluate_pitcher_props(props_df, statcast_df):
+    # Works on any subset of the board: features are per pitcher, so a few selections
+    # evaluate the same as they would within the full slate
+    props_df = props_df.copy()
+    opp_splits, pitcher_games = pitcher_tables(statcast_df)
+
+    # Resolve each pitcher once, then evaluate the whole slate in one pass
+    with span('resolve_ids'):
+        pitcher_ids = {name: resolve_player_id(name) for name in props_df['pitcher_name'].unique()}
+        props_df['pitcher_id'] = props_df['pitcher_name'].map(pitcher_ids)
+    with span('player_profiles'):
+        known_pitchers = set(pitcher_games['pitcher'].unique())
+        profiles = profile_frame(props_df.loc[props_df['pitcher_id'].isin(known_pitchers), 'pitcher_id'])
+        props_df['team'] = props_df['pitcher_id'].map(profiles.set_index('mlbam_id')['team'])
+    with span('evaluate'):
+        count('props', len(props_df))
+        return evaluate_pitcher_memo(props_df, pitcher_games, opp_splits, data_version(statcast_df))
+
+
+def evaluate_pitcher_memo(props_df, pitcher_games, opp_splits, version):
+    # evaluate_slate over only the props not memoized for this data version; every row
+    # evaluates independently of the rest of the slate, so results can be reassembled
+    props_df = props_df[props_df['pitcher_id'].notna()]
+    keys = [
+        memo_key('pitcher', pid, opponent, type, line, label.lower(), version)
+        for pid, opponent, type, line, label in zip(props_df['pitcher_id'], props_df['opponent'], props_df['type'], props_df['line'], props_df['label'])
+    ]
+    rows = {key: memo.get(key) for key in dict.fromkeys(keys)}
+    misses = [is_missing(rows[key]) for key in keys]
+
+    if any(misses):
+        pending_keys = pd.Series([key for key, miss in zip(keys, misses) if miss])
+        first = ~pending_keys.duplicated().to_numpy()
+        pending = props_df[misses][first]
+        count('rows_scanned', len(pitcher_games))
+        results = evaluate_slate(pending, pitcher_games, opp_splits)
+        by_selection = {
+            (name, type, line, label): row
+            for name, type, line, label, row in zip(results['Pitcher'], results['Prop'], results['Line'], results['Direction'], results.to_dict('records'))
+        }
+        for key, name, type, line, label in zip(pending_keys[first], pending['pitcher_name'], pending['type'], pending['line'], pending['label']):
+            rows[key] = memo.set(key, by_selection.get((name, type, line, label)))
+
+    # Rows that could not be evaluated are memoized as None and dropped, as evaluate_slate does
+    evaluated = [
+        {**rows[key], 'Pitcher': name, 'Team': team, 'Odds': odds}
+        for key, name, team, odds in zip(keys, props_df['pitcher_name'], props_df['team'], props_df['odds'])
+        if rows[key] is not None
+    ]
+    return pd.DataFrame(evaluated, columns=RESULT_COLUMNS)
+
+
+def pitcher_plays():
+    # (final_df, Statcast data version); final_df is None when the odds could not be fetched
+    with span('draftkings_odds'):
+        props_df = pitcher_lines_today()
+    with span('statcast'):
+        statcast_df = season_statcast()
+    if props_df is None:
+        return None, data_version(statcast_df)
+    return evaluate_pitcher_props(props_df, statcast_df), data_version(statcast_df)
+
+
+# ---------------------- Batter Plays ----------------------
+
+def _tb_result(indexes, bid, opp_pid, line, direction):
+    batter_df = indexes['batter'].get(bid)
+    if batter_df.empty: return None
+    pitcher_df = indexes['pitcher'].get(opp_pid)
+    if pitcher_df.empty: return None
+    count('rows_scanned', len(batter_df) + len(pitcher_df))
+    return evaluate_tb_rules(batter_df, pitcher_df, pitcher_df['p_throws'].iloc[0], batter_df['stand'].iloc[0], line, TB_LOOKBACK, direction)
+
+
+def evaluate_batter_props(props_df, indexes, version=None):
+    # With a data version, each (batter, pitcher, line, direction) is evaluated once per version
+    evaluated = []
+    for _, row in props_df.iterrows():
+        batter_name, team, bid, opp_pid, label, line, odds, type = row['batter_name'], row['team'], row['batter_id'], row['opp_pid'], row['label'], row['line'], row['odds'], row['type']
+        if version is None:
+            result = _tb_result(indexes, bid, opp_pid, line, label.lower())
+        else:
+            key = memo_key('batter', bid, opp_pid, TB_LOOKBACK, line, label.lower(), version)
+            result = memo.get(key)
+            if is_missing(result):
+                result = memo.set(key, _tb_result(indexes, bid, opp_pid, line, label.lower()))
+        if not result: continue
+
+        evaluated.append({
+            'Batter': batter_name,
+            'Team': team,
+            'Prop': type,
+            'Line': line,
+            'Odds': odds,
+            'Direction': label,
+            'Rolling Average Total Bases (Last 17 Games)': result['rolling_avg_tb'],
+            'Avg Total Bases vs. Hand (Last 17 Games)': result['vs_hand_split'],
+            'Avg xSLG': result['avg_xslg'],
+            'Avg ISO': result['avg_iso'],
+            'Pitcher xSLG Allowed': result['pitcher_xslg_allowed'],
+            'Pitcher Total Bases Allowed per PA': result['pitcher_tb_allowed_per_pa'],
+            'Total Bases Hit Rate (L17)': result['hit_rate'],
+            'Rules Hit': result['score'],
+            'Recommendation': 'Target' if result['score'] >= 4 else 'Pass'
+        })
+    return pd.DataFrame(evaluated)
+
+
+def batter_indexes(statcast_df):
+    return cache.get_or_load(('player_index', data_version(statcast_df)), lambda: build_indexes(statcast_df), ttl=6 * HOUR)
+
+
+def batter_plays():
+    # (final_df, Statcast data version); final_df is None when the odds could not be fetched
+    with span('draftkings_odds'):
+        props_df = batter_lines_today()
+    with span('statcast'):
+        statcast_df = season_statcast()
+    if props_df is None:
+        return None, data_version(statcast_df)
+
+    with span('player_index'):
+        indexes = batter_indexes(statcast_df)
+
+    with span('evaluate'):
+        count('props', len(props_df))
+        final_df = evaluate_batter_props(props_df, indexes, data_version(statcast_df))
+    return final_df, data_version(statcast_df)
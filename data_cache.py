@@ -0,0 +1,152 @@
+import sys
+import time
+import pickle
+import threading
+from collections import OrderedDict
+import pandas as pd
+from instrumentation import count
+
+# Process-wide cache shared by every page and every Streamlit session.
+# Modules are imported once per server process, so the `cache` instance at the
+# bottom of this file outlives page reruns and browser sessions.
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class DataCache:
+    def __init__(self, max_mb=1024):
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.RLock()
+        self._loading = {}  # key -> [lock, sessions holding or waiting on it], only while a load runs
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _acquire_loader(self, key):
+        with self._lock:
+            loader = self._loading.setdefault(key, [threading.Lock(), 0])
+            loader[1] += 1
+            return loader
+
+    def _release_loader(self, key, loader):
+        # The last session out drops the lock, so keys with dates and data versions in
+        # them do not leave a lock behind for the life of the process
+        with self._lock:
+            loader[1] -= 1
+            if loader[1] == 0:
+                del self._loading[key]
+
+    def _hit(self):
+        with self._lock:
+            self.hits += 1
+        count('cache_hits')
+
+    def _pop(self, key):
+        value, _, size = self._entries.pop(key)
+        self.total_bytes -= size
+        return value
+
+    def _evict(self):
+        # Least recently used entries are at the front of the OrderedDict
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._pop(oldest)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and time.time() >= expires_at:
+                self._pop(key)
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def __contains__(self, key):
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def set(self, key, value, ttl=None):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            expires_at = time.time() + ttl if ttl is not None else None
+            self._entries[key] = (value, expires_at, size)
+            self.total_bytes += size
+            self._evict()
+        return value
+
+    def get_or_load(self, key, loader, ttl=None):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            self._hit()
+            return value
+        # One loader per key: concurrent sessions wait for the first fetch instead of repeating it
+        key_loader = self._acquire_loader(key)
+        try:
+            with key_loader[0]:
+                value = self.get(key, sentinel)
+                if value is not sentinel:
+                    self._hit()
+                    return value
+                with self._lock:
+                    self.misses += 1
+                count('cache_misses')
+                return self.set(key, loader(), ttl=ttl)
+        finally:
+            self._release_loader(key, key_loader)
+
+    def invalidate(self, key=None, prefix=None):
+        # Keys are tuples like ('odds', 'pitcher'); prefix matches on the first element
+        with self._lock:
+            if key is None and prefix is None:
+                self._entries.clear()
+                self.total_bytes = 0
+                return
+            if key is not None and key in self._entries:
+                self._pop(key)
+            if prefix is not None:
+                for k in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == prefix]:
+                    self._pop(k)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_mb': round(self.total_bytes / 1024 ** 2, 2),
+                'max_mb': round(self.max_bytes / 1024 ** 2, 2),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+cache = DataCache(max_mb=1024)
+
+
+def cached(prefix, ttl=None):
+    # Decorator form: cache a function's result keyed by its name and positional arguments
+    def decorator(func):
+        def wrapper(*args):
+            return cache.get_or_load((prefix, func.__name__) + args, lambda: func(*args), ttl=ttl)
+        wrapper.__name__ = func.__name__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
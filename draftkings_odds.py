@@ -0,0 +1,147 @@
+import pandas as pd
+from http_client import get_json, get_json_many, DRAFTKINGS_BASE_URL
+from player_resolver import resolve_many
+from player_profiles import fetch_profiles
+from data_cache import cached, MINUTE
+from teams import mlb_team_abbreviations
+from instrumentation import span
+
+# Today's DraftKings pitcher and batter prop boards, parsed into one row per selection.
+
+HEADERS = {
+    "accept": "application/json",  # changed to expect JSON response
+    "accept-encoding": "gzip, deflate, br, zstd",
+    "accept-language": "en-US,en;q=0.9",
+    "cache-control": "max-age=0",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
+    "upgrade-insecure-requests": "1",
+    "sec-fetch-dest": "document",
+    "sec-fetch-mode": "navigate",
+    "sec-fetch-site": "none",
+    "sec-fetch-user": "?1",
+    "sec-ch-ua": '"Chromium";v="136", "Google Chrome";v="136", "Not.A/Brand";v="99"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+}
+
+PITCHER_URLS = {
+    'Hits Allowed': f'{DRAFTKINGS_BASE_URL}/api/sportscontent/dkusdc/v1/leagues/84240/categories/1031/subcategories/9886',
+    'Strikeouts': f'{DRAFTKINGS_BASE_URL}/api/sportscontent/dkusdc/v1/leagues/84240/categories/1031/subcategories/15221',
+    'Pitching Outs': f'{DRAFTKINGS_BASE_URL}/api/sportscontent/dkusdc/v1/leagues/84240/categories/1031/subcategories/17413',
+    'Walks Allowed': f'{DRAFTKINGS_BASE_URL}/api/sportscontent/dkusdc/v1/leagues/84240/categories/1031/subcategories/15219'
+}
+BATTER_URLS = {
+    'Total Bases': f'{DRAFTKINGS_BASE_URL}/api/sportscontent/dkusdc/v1/leagues/84240/categories/743/subcategories/6607',
+}
+
+
+def safe_int(s):
+    return int(s.replace('−', '-').replace('+', ''))
+
+
+@cached('odds', ttl=MINUTE)
+def pitcher_lines_today():
+    pitcher_data = []
+    pitcher_keys = []
+
+    # All four subcategories are fetched concurrently; the per-host rate limiter keeps us polite
+    responses = get_json_many(PITCHER_URLS, headers=HEADERS, timeout=5)
+
+    kJSON = responses['Strikeouts']
+    if kJSON is None:
+        return None
+
+    for event in kJSON['events']:
+        if 'startingPitcherPlayerName' in event['participants'][0]['metadata']:
+            pitcher_keys.append((event['participants'][0]['metadata']['startingPitcherPlayerName'], event['participants'][1]['metadata']['shortName']))
+        if 'startingPitcherPlayerName' in event['participants'][1]['metadata']:
+            pitcher_keys.append((event['participants'][1]['metadata']['startingPitcherPlayerName'], event['participants'][0]['metadata']['shortName']))
+    pitcher_dict = {pitcher: opponent for pitcher, opponent in pitcher_keys}
+
+    # Other subcategories fall back to no selections when they fail
+    poJSON = responses['Pitching Outs'] or {'selections': []}
+    haJSON = responses['Hits Allowed'] or {'selections': []}
+    waJSON = responses['Walks Allowed'] or {'selections': []}
+
+    selections = [kJSON, poJSON, haJSON, waJSON]
+    type = ['Strikeouts', 'Pitching Outs', 'Hits Allowed', 'Walks Allowed']
+
+    for i in range(len(selections)):
+        for selection in selections[i]['selections']:
+            if safe_int(selection['displayOdds']['american']) < -160:
+                continue
+            pitcher_name = selection['participants'][0]['name']
+            opponent = pitcher_dict.get(pitcher_name, 'Unknown')
+            line = selection['points']
+            label = selection['label']
+            odds = selection['displayOdds']['american']
+
+            pitcher_data.append({
+                'pitcher_name': pitcher_name,
+                'opponent': opponent,
+                'label': label,
+                'line': line,
+                'odds': odds,
+                'type': type[i]
+            })
+
+    return pd.DataFrame(pitcher_data)
+
+
+@cached('odds', ttl=MINUTE)
+def batter_lines_today():
+    batter_data = []
+    opp_pitcher_dict = {}
+
+    with span('draftkings_fetch'):
+        tbJSON = get_json(BATTER_URLS['Total Bases'], headers=HEADERS, timeout=5)
+    if tbJSON is None:
+        return None
+
+    for event in tbJSON['events']:
+        if 'startingPitcherPlayerName' in event['participants'][0]['metadata']:
+            opp_pitcher_dict[event['participants'][1]['metadata']['shortName']] = event['participants'][0]['metadata']['startingPitcherPlayerName']
+        if 'startingPitcherPlayerName' in event['participants'][1]['metadata']:
+            opp_pitcher_dict[event['participants'][0]['metadata']['shortName']] = event['participants'][1]['metadata']['startingPitcherPlayerName']
+
+    # Stage 1: collect the selections on the board
+    for selection in tbJSON['selections']:
+        if int(safe_int(selection['displayOdds']['american'])) < -160:
+            continue
+        batter_data.append({
+            'batter_name': selection['participants'][0]['name'],
+            'label': selection['label'],
+            'line': selection['points'],
+            'odds': selection['displayOdds']['american'],
+            'type': 'Total Bases'
+        })
+    selections = pd.DataFrame(batter_data, columns=['batter_name', 'label', 'line', 'odds', 'type'])
+
+    # Stage 2: resolve each unique batter once (Over and Under share a lookup)
+    with span('resolve_batters'):
+        batter_ids = resolve_many(selections['batter_name'])
+        selections['batter_id'] = selections['batter_name'].map(batter_ids)
+        selections = selections[selections['batter_id'].notna()]
+        resolved_count = len(selections)
+
+    # Stage 3: hydrate teams in batches and find each batter's opposing starter
+    with span('player_profiles'):
+        profiles = fetch_profiles(selections['batter_id'])
+        selections['team'] = selections['batter_id'].map(lambda bid: mlb_team_abbreviations.get(profiles[int(bid)]['team']))
+        selections['opp_pitcher_name'] = selections['team'].map(opp_pitcher_dict)
+        selections = selections[selections['opp_pitcher_name'].notna()]
+        matched_count = len(selections)
+
+    # Stage 4: resolve each opposing starter once for his whole opponent roster
+    with span('resolve_pitchers'):
+        pitcher_ids = resolve_many(selections['opp_pitcher_name'])
+        selections['opp_pid'] = selections['opp_pitcher_name'].map(pitcher_ids)
+        selections = selections[selections['opp_pid'].notna()]
+
+    # The old per-selection loop did an ID lookup, a profile fetch and an opposing-pitcher lookup for each row
+    per_selection_lookups = len(batter_data) + resolved_count + matched_count
+    unique_lookups = len(batter_ids) + len(profiles) + len(pitcher_ids)
+    print(f"batter_lines_today: {unique_lookups} lookups for {len(batter_data)} selections ({per_selection_lookups - unique_lookups} saved)")
+
+    selections = selections.astype({'batter_id': int, 'opp_pid': int})
+    return selections[['batter_name', 'team', 'batter_id', 'opp_pid', 'label', 'line', 'odds', 'type']].reset_index(drop=True)
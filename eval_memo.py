@@ -0,0 +1,149 @@
+import os
+import pickle
+import sqlite3
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+import numpy as np
+from instrumentation import count
+
+# Memoized prop evaluations. A prop's result depends only on the players, opponent,
+# line and direction, the Statcast data version and the rule code, so those make the
+# key and an unchanged prop is never evaluated twice within a data version. Entries
+# live in a bounded in-memory LRU; with EVAL_MEMO_DIR set, entries evicted from memory
+# spill to a SQLite file there and are promoted back on their next hit.
+
+MAX_ENTRIES = 50000
+MAX_DISK_ENTRIES = 500000
+SPILL_DIR = os.environ.get('EVAL_MEMO_DIR')
+
+_MISSING = object()
+
+
+# Every module whose code shapes a memoized result: the rule engines, the derived
+# tables they read and the pipeline that builds the keys (TB_LOOKBACK and friends)
+RULES_MODULES = ['pitcher_engine', 'batter_engine', 'pitcher_games', 'opponent_splits', 'player_index', 'daily_plays']
+
+
+def _rules_version():
+    # Spilled entries outlive the process, so a change to any of those has to change every key.
+    # Sources are read from disk so daily_plays, which imports this module, is not imported here.
+    h = hashlib.sha1()
+    for name in RULES_MODULES:
+        with open(importlib.util.find_spec(name).origin, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+RULES_VERSION = _rules_version()
+
+
+def _plain(part):
+    # numpy scalars and Python numbers must produce the same key
+    if isinstance(part, (np.integer, bool)):
+        return int(part)
+    if isinstance(part, (np.floating, float)):
+        return float(part)
+    return part
+
+
+def memo_key(kind, *parts):
+    return (kind, RULES_VERSION) + tuple(_plain(part) for part in parts)
+
+
+class EvalMemo:
+    def __init__(self, max_entries=MAX_ENTRIES, spill_dir=None):
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.spilled = 0
+
+    def _disk(self):
+        if self._conn is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.spill_dir, "eval_memo.db"), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS memo (key TEXT PRIMARY KEY, value BLOB)")
+        return self._conn
+
+    @staticmethod
+    def _disk_key(key):
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+    def _spill(self, evicted):
+        conn = self._disk()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO memo (key, value) VALUES (?, ?)",
+                [(self._disk_key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for key, value in evicted]
+            )
+            conn.execute("DELETE FROM memo WHERE rowid <= (SELECT MAX(rowid) FROM memo) - ?", (MAX_DISK_ENTRIES,))
+        self.spilled += len(evicted)
+
+    def _evict(self):
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False))
+        if evicted and self.spill_dir:
+            self._spill(evicted)
+
+    def get(self, key):
+        # The stored value (which may be None for "no result"), or _MISSING
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                count('memo_hits')
+                return self._entries[key]
+            if self.spill_dir:
+                row = self._disk().execute("SELECT value FROM memo WHERE key = ?", (self._disk_key(key),)).fetchone()
+                if row is not None:
+                    value = pickle.loads(row[0])
+                    self._entries[key] = value
+                    self._evict()
+                    self.hits += 1
+                    self.disk_hits += 1
+                    count('memo_hits')
+                    return value
+            self.misses += 1
+            count('memo_misses')
+            return _MISSING
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.spill_dir:
+                conn = self._disk()
+                with conn:
+                    conn.execute("DELETE FROM memo")
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'spilled': self.spilled,
+            }
+
+
+memo = EvalMemo(spill_dir=SPILL_DIR)
+
+
+def is_missing(value):
+    return value is _MISSING
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import contextvars
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from instrumentation import count
+
+# Shared HTTP layer: one pooled session, a token bucket per host so we stay polite to
+# DraftKings / the Stats API without sleeping on the calling thread, retries with
+# exponential backoff for timeouts, 429s and 5xx responses, and an on-disk cache of
+# successful JSON responses keyed by URL.
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Upstream base URLs; point these at the stand-in servers (standin_server.py) to run
+# the pages offline or under injected latency and failures
+DRAFTKINGS_BASE_URL = os.environ.get('DRAFTKINGS_BASE_URL', 'https://sportsbook-nash.draftkings.com').rstrip('/')
+STATSAPI_BASE_URL = os.environ.get('STATSAPI_BASE_URL', 'https://statsapi.mlb.com').rstrip('/')
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate  # tokens added per second
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# requests/second and burst size per host; anything else gets DEFAULT_LIMIT
+HOST_LIMITS = {
+    urlparse(DRAFTKINGS_BASE_URL).netloc: (1.0, 4),
+    urlparse(STATSAPI_BASE_URL).netloc: (10.0, 10),
+}
+DEFAULT_LIMIT = (5.0, 5)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+
+def _limiter(url):
+    host = urlparse(url).netloc
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = TokenBucket(*HOST_LIMITS.get(host, DEFAULT_LIMIT))
+        return _limiters[host]
+
+
+def get(url, headers=None, timeout=5, retries=2, backoff=0.5):
+    # Returns the last response (possibly non-200), or None if every attempt raised
+    response = None
+    for attempt in range(retries + 1):
+        _limiter(url).acquire()
+        count('http_requests')
+        try:
+            response = _session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"Request to {url} failed: {e}")
+            response = None
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            return response
+        if attempt < retries:
+            count('http_retries')
+            delay = backoff * (2 ** attempt)
+            if response is not None and response.headers.get('Retry-After', '').isdigit():
+                delay = max(delay, int(response.headers['Retry-After']))
+            time.sleep(delay)
+    return response
+
+
+# ---------------------- Response Cache ----------------------
+
+CACHE_DIR = os.path.join(os.getcwd(), "http_cache")
+CACHE_MAX_MB = 200
+
+# (url substring, ttl in seconds); first match wins, unmatched URLs are not cached
+CACHE_TTLS = [
+    (f'{STATSAPI_BASE_URL}/api/v1/people', 6 * 60 * 60),
+    (DRAFTKINGS_BASE_URL, 60),
+]
+
+# Replay-only mode serves every request from the cache, whatever its age, and never
+# touches the network. Useful for running the pages against recorded responses.
+REPLAY_ONLY = os.environ.get('HTTP_REPLAY_ONLY', '') == '1'
+
+_cache_lock = threading.Lock()
+
+
+def _cache_ttl(url):
+    for pattern, ttl in CACHE_TTLS:
+        if pattern in url:
+            return ttl
+    return 0
+
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+
+def _read_cache(url, ttl):
+    path = _cache_path(url)
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not REPLAY_ONLY and time.time() - entry['fetched_at'] >= ttl:
+        return None
+    # Touch the file so size-bounded eviction drops least recently used entries first
+    os.utime(path)
+    return entry['body']
+
+
+def _write_cache(url, body):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'url': url, 'fetched_at': time.time(), 'body': body}, f)
+    os.replace(tmp_path, path)
+    _evict_cache()
+
+
+def _evict_cache():
+    with _cache_lock:
+        entries = [e for e in os.scandir(CACHE_DIR) if e.name.endswith('.json')]
+        total = sum(e.stat().st_size for e in entries)
+        max_bytes = CACHE_MAX_MB * 1024 ** 2
+        if total <= max_bytes:
+            return
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
+
+
+def get_json(url, headers=None, timeout=5, retries=2, ttl=None):
+    ttl = _cache_ttl(url) if ttl is None else ttl
+    if ttl > 0 or REPLAY_ONLY:
+        body = _read_cache(url, ttl)
+        if body is not None:
+            count('http_cache_hits')
+            return json.loads(body)
+    if REPLAY_ONLY:
+        print(f"No recorded response for {url}")
+        return None
+
+    response = get(url, headers=headers, timeout=timeout, retries=retries)
+    if response is None or response.status_code != 200:
+        status = response.status_code if response is not None else 'no response'
+        print(f"Failed to fetch {url}. Status code: {status}")
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        print(f"Failed to decode JSON from {url}")
+        return None
+    if ttl > 0:
+        _write_cache(url, response.text)
+    return data
+
+
+def get_json_many(urls, headers=None, timeout=5, retries=2):
+    # urls: {name: url}. Fetched concurrently; failed entries come back as None
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+        # Each worker runs in a copy of the caller's context so its requests count toward the caller's run
+        futures = {name: pool.submit(contextvars.copy_context().run, get_json, url, headers, timeout, retries) for name, url in urls.items()}
+        return {name: future.result() for name, future in futures.items()}
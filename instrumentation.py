@@ -0,0 +1,112 @@
+import os
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+
+# Lightweight per-run instrumentation: nested timing spans and counters for one page
+# run, shown in a sidebar panel and appended to a JSON-lines log. Outside a run (the
+# backtester, benchmarks) span() and count() do nothing.
+
+LOG_PATH = os.environ.get('TIMINGS_LOG', os.path.join(os.getcwd(), "logs", "timings.jsonl"))
+
+_current_run = contextvars.ContextVar('current_run', default=None)
+_span_depth = contextvars.ContextVar('span_depth', default=0)
+
+
+class Run:
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self.timestamp = datetime.now().isoformat()
+        self.spans = []  # (name, depth, start offset, duration) in completion order
+        self.counters = {}
+        self.total = None
+        self._lock = threading.Lock()
+
+    def add_span(self, name, depth, start, duration):
+        with self._lock:
+            self.spans.append((name, depth, start - self.started, duration))
+
+    def add(self, counter, n):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def as_dict(self):
+        spans = sorted(self.spans, key=lambda s: (s[2], s[1]))
+        return {
+            'ts': self.timestamp,
+            'page': self.page,
+            'total_ms': round((self.total or 0) * 1000, 2),
+            'spans': [{'name': name, 'depth': depth, 'start_ms': round(start * 1000, 2), 'ms': round(duration * 1000, 2)}
+                      for name, depth, start, duration in spans],
+            'counters': dict(self.counters),
+        }
+
+
+def start_run(page):
+    run = Run(page)
+    _current_run.set(run)
+    _span_depth.set(0)
+    return run
+
+
+def current_run():
+    return _current_run.get()
+
+
+@contextmanager
+def span(name):
+    run = _current_run.get()
+    if run is None:
+        yield
+        return
+    depth = _span_depth.get()
+    token = _span_depth.set(depth + 1)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.add_span(name, depth, start, time.perf_counter() - start)
+        _span_depth.reset(token)
+
+
+def count(counter, n=1):
+    run = _current_run.get()
+    if run is not None:
+        run.add(counter, n)
+
+
+def finish_run(run=None):
+    # Closes the run and appends it to the JSON-lines log
+    run = run or _current_run.get()
+    if run is None:
+        return None
+    run.total = time.perf_counter() - run.started
+    try:
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        with open(LOG_PATH, 'a') as f:
+            f.write(json.dumps(run.as_dict()) + '\n')
+    except OSError as e:
+        print(f"Failed to write timings to {LOG_PATH}: {e}")
+    _current_run.set(None)
+    return run
+
+
+def render_timings(run):
+    # Collapsible sidebar panel with the span tree and counters of a finished run
+    import streamlit as st
+    import pandas as pd
+
+    data = run.as_dict()
+    with st.sidebar.expander(f"⏱ Timings ({data['total_ms'] / 1000:.2f}s)"):
+        spans = pd.DataFrame(data['spans'], columns=['name', 'depth', 'start_ms', 'ms'])
+        spans['stage'] = [' ' * depth + name for name, depth in zip(spans['name'], spans['depth'])]
+        st.dataframe(spans[['stage', 'ms']], hide_index=True, use_container_width=True)
+        if data['counters']:
+            st.dataframe(
+                pd.DataFrame(sorted(data['counters'].items()), columns=['counter', 'value']),
+                hide_index=True, use_container_width=True
+            )
@@ -0,0 +1,230 @@
+import time
+import threading
+from datetime import datetime
+from collections import defaultdict
+import pandas as pd
+from statcast_store import data_version
+from draftkings_odds import pitcher_lines_today, batter_lines_today
+from daily_plays import season_statcast, evaluate_pitcher_props, evaluate_batter_props, batter_indexes
+
+# Background polling of the DraftKings boards. Each poll diffs the board against the
+# previous one by (player, prop type, label, line, odds): selections that are new or
+# whose line moved are evaluated, odds-only moves just reprice the existing row, and
+# selections that left the board drop out. Only the first poll, or a poll after the
+# Statcast data version changes, evaluates the whole slate.
+
+POLL_INTERVAL = 60  # seconds; the odds feed is cached for a minute anyway
+SUBSCRIBER_TIMEOUT = 3 * POLL_INTERVAL  # a live session not seen for this long is dropped
+MAX_MOVES = 500
+
+MOVE_COLUMNS = ['time', 'player', 'type', 'label', 'change', 'old_line', 'new_line', 'old_odds', 'new_odds']
+
+
+def _evaluate_pitchers(props, statcast_df):
+    return evaluate_pitcher_props(props, statcast_df)
+
+
+def _evaluate_batters(props, statcast_df):
+    return evaluate_batter_props(props, batter_indexes(statcast_df), data_version(statcast_df))
+
+
+# Board fetch (bypassing the odds cache), evaluator, board player column, results player column
+PIPELINES = {
+    'pitcher_plays': (pitcher_lines_today.__wrapped__, _evaluate_pitchers, 'pitcher_name', 'Pitcher'),
+    'batter_plays': (batter_lines_today.__wrapped__, _evaluate_batters, 'batter_name', 'Batter'),
+}
+
+
+class OddsPoller:
+    def __init__(self, name, interval=POLL_INTERVAL):
+        self.name = name
+        self.interval = interval
+        self.fetch, self.evaluate, self.player_col, self.result_player_col = PIPELINES[name]
+        self.board = None
+        self.results = None
+        self.version = None
+        self.moves = pd.DataFrame(columns=MOVE_COLUMNS)
+        self.last_poll = None
+        self.last_stats = {}
+        self.polls = 0
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+        self._subscribers = {}  # session id -> last time that session's live view refreshed
+
+    def _board_keys(self, board):
+        return board[[self.player_col, 'type', 'label', 'line', 'odds']].itertuples(index=False, name=None)
+
+    def _result_keys(self, results):
+        return results[[self.result_player_col, 'Prop', 'Direction', 'Line', 'Odds']].itertuples(index=False, name=None)
+
+    def poll(self):
+        start = time.perf_counter()
+        board = self.fetch()
+        if board is None:
+            print(f"odds_poller[{self.name}]: board unavailable, keeping the previous poll")
+            return None
+        board = board.drop_duplicates([self.player_col, 'type', 'label', 'line', 'odds']).reset_index(drop=True)
+        statcast_df = season_statcast()
+        version = data_version(statcast_df)
+
+        with self._lock:
+            previous, results = self.board, self.results
+        if previous is None or results is None or version != self.version:
+            # First poll or new Statcast data: everything has to be evaluated
+            results = self.evaluate(board, statcast_df)
+            stats = {'evaluated': len(board), 'new': len(board), 'line_moves': 0, 'odds_moves': 0, 'removed': 0}
+            moves = pd.DataFrame(columns=MOVE_COLUMNS)
+        else:
+            results, moves, stats = self._apply_diff(previous, board, results, statcast_df)
+
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        with self._lock:
+            self.board, self.results, self.version = board, results, version
+            if not moves.empty:
+                self.moves = pd.concat([moves, self.moves], ignore_index=True).head(MAX_MOVES)
+            self.last_poll = datetime.now()
+            self.last_stats = stats
+            self.polls += 1
+        print(f"odds_poller[{self.name}]: {stats}")
+        return stats
+
+    def _apply_diff(self, previous, board, results, statcast_df):
+        prev_keys = set(self._board_keys(previous))
+        cur_keys = list(self._board_keys(board))
+        added = [key for key in cur_keys if key not in prev_keys]
+        removed = prev_keys - set(cur_keys)
+
+        # An added selection is an odds move if the same player/type/label/line was on the previous board
+        removed_by_line = {key[:4]: key for key in removed}
+        repriced = {removed_by_line[key[:4]]: key for key in added if key[:4] in removed_by_line}
+        to_evaluate = [key for key in added if key[:4] not in removed_by_line]
+
+        # Rows for selections that left the board (or moved their line) drop out,
+        # odds-only moves keep their row with the new price
+        if not results.empty:
+            result_keys = list(self._result_keys(results))
+            keep = [key not in removed or key in repriced for key in result_keys]
+            results = results[keep].copy()
+            new_odds = [repriced.get(key, key)[4] for key, kept in zip(result_keys, keep) if kept]
+            results['Odds'] = new_odds
+
+        if to_evaluate:
+            to_evaluate_set = set(to_evaluate)
+            changed = board[[key in to_evaluate_set for key in cur_keys]]
+            evaluated = self.evaluate(changed, statcast_df)
+            if not evaluated.empty:
+                results = pd.concat([results, evaluated], ignore_index=True) if not results.empty else evaluated
+        results = results.reset_index(drop=True)
+
+        now = datetime.now().strftime('%H:%M:%S')
+        moves = []
+        for old in removed:
+            if old in repriced:
+                new = repriced[old]
+                moves.append((now, *old[:3], 'odds', old[3], new[3], old[4], new[4]))
+
+        # A player can carry several alt lines per prop and direction, so unmatched old and
+        # new selections are grouped by player/type/label. When a group lost as many lines
+        # as it gained, they moved together and pair up in line order; otherwise there is
+        # no reliable pairing and they are logged as removed and new
+        olds_by_player, news_by_player = defaultdict(list), defaultdict(list)
+        for old in removed:
+            if old not in repriced:
+                olds_by_player[old[:3]].append(old)
+        for new in to_evaluate:
+            news_by_player[new[:3]].append(new)
+        for player_key in olds_by_player.keys() | news_by_player.keys():
+            olds = sorted(olds_by_player[player_key], key=lambda key: key[3])
+            news = sorted(news_by_player[player_key], key=lambda key: key[3])
+            if olds and len(olds) == len(news):
+                for old, new in zip(olds, news):
+                    moves.append((now, *player_key, 'line', old[3], new[3], old[4], new[4]))
+                continue
+            for old in olds:
+                moves.append((now, *player_key, 'removed', old[3], None, old[4], None))
+            for new in news:
+                moves.append((now, *player_key, 'new', None, new[3], None, new[4]))
+
+        line_moves = sum(move[4] == 'line' for move in moves)
+        stats = {
+            'evaluated': len(to_evaluate),
+            'new': len(to_evaluate) - line_moves,
+            'line_moves': line_moves,
+            'odds_moves': len(repriced),
+            'removed': len(removed) - len(repriced) - line_moves,
+        }
+        moves = pd.DataFrame(moves, columns=MOVE_COLUMNS).sort_values(['player', 'type', 'label', 'old_line', 'new_line'], ignore_index=True)
+        return results, moves, stats
+
+    def _loop(self, stop):
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"odds_poller[{self.name}]: poll failed: {e}")
+            stop.wait(self.interval)
+            if not stop.is_set() and not self._has_subscribers():
+                # Every live session closed or went quiet without switching the toggle off
+                print(f"odds_poller[{self.name}]: no live sessions, stopping")
+                stop.set()
+
+    def _has_subscribers(self):
+        with self._lock:
+            now = time.monotonic()
+            self._subscribers = {sid: seen for sid, seen in self._subscribers.items() if now - seen < SUBSCRIBER_TIMEOUT}
+            return bool(self._subscribers)
+
+    def subscribe(self, session_id):
+        # Called on every live render, so it also keeps the session's subscription fresh
+        with self._lock:
+            self._subscribers[session_id] = time.monotonic()
+        self.start()
+
+    def unsubscribe(self, session_id):
+        # Only a session that was live can stop the poller, and only as the last one
+        with self._lock:
+            if self._subscribers.pop(session_id, None) is None or self._subscribers:
+                return
+        self.stop()
+
+    def start(self):
+        # Each thread gets its own stop event, so a restart never waits on a poll in flight
+        with self._lock:
+            if self.running:
+                return
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._loop, args=(self._stop,), name=f"odds_poller-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def state(self):
+        # Consistent copy of the latest results, recent moves and poll stats for display
+        with self._lock:
+            return {
+                'results': None if self.results is None else self.results.copy(),
+                'moves': self.moves.copy(),
+                'last_poll': self.last_poll,
+                'last_stats': dict(self.last_stats),
+                'polls': self.polls,
+                'version': self.version,
+            }
+
+
+_pollers = {}
+_pollers_lock = threading.Lock()
+
+
+def get_poller(name, interval=POLL_INTERVAL):
+    # One poller per board for the whole process, shared by every session
+    with _pollers_lock:
+        if name not in _pollers:
+            _pollers[name] = OddsPoller(name, interval)
+        return _pollers[name]
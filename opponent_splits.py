@@ -0,0 +1,46 @@
+import pandas as pd
+
+HIT_EVENTS = ['single', 'double', 'triple', 'home_run']
+AT_BAT_EVENTS = HIT_EVENTS + [
+    'strikeout', 'field_out', 'force_out', 'double_play', 'grounded_into_double_play',
+    'strikeout_double_play', 'fielders_choice_out', 'sac_fly_double_play', 'triple_play'
+]
+
+# Values the evaluators fall back to when a team has no rows against a hand
+DEFAULT_RATES = {'k_pct': 0, 'bb_pct': 0, 'whip': 2.0, 'avg': 0.25}
+
+
+def build_opponent_splits(df):
+    # One row per (batting team, pitcher hand). The batting team is picked with the
+    # same home/away + inning_topbot mask the evaluators used to apply per prop.
+    topbot = df['inning_topbot'].astype(object)
+    team = df['away_team'].astype(object).where(topbot == 'Top', df['home_team'].astype(object).where(topbot == 'Bottom'))
+    events = df['events'].astype(object)
+    frame = pd.DataFrame({
+        'team': team,
+        'hand': df['p_throws'].astype(object),
+        'batter': df['batter'],
+        'strikeouts': events == 'strikeout',
+        'walks': events == 'walk',
+        'walks_hbp': events.isin(['walk', 'hit_by_pitch']),
+        'hits': events.isin(HIT_EVENTS),
+        'at_bats': events.isin(AT_BAT_EVENTS),
+    }).dropna(subset=['team', 'hand'])
+
+    # Plate appearances are counted as batter changes in row order within each split
+    frame['pas'] = frame['batter'].ne(frame.groupby(['team', 'hand'], sort=False)['batter'].shift())
+
+    splits = frame.groupby(['team', 'hand'])[['pas', 'strikeouts', 'walks', 'walks_hbp', 'hits', 'at_bats']].sum()
+    splits['k_pct'] = (splits['strikeouts'] / splits['pas']).where(splits['pas'] > 0, DEFAULT_RATES['k_pct'])
+    splits['bb_pct'] = (splits['walks'] / splits['pas']).where(splits['pas'] > 0, DEFAULT_RATES['bb_pct'])
+    ip = splits['pas'] / 3
+    splits['whip'] = ((splits['hits'] + splits['walks_hbp']) / ip).where(ip > 0, DEFAULT_RATES['whip'])
+    splits['avg'] = (splits['hits'] / splits['at_bats']).where(splits['at_bats'] > 0, DEFAULT_RATES['avg'])
+    return splits
+
+
+def opponent_rates(splits, team, hand):
+    if (team, hand) in splits.index:
+        row = splits.loc[(team, hand)]
+        return {k: row[k] for k in DEFAULT_RATES}
+    return dict(DEFAULT_RATES)
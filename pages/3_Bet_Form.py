@@ -1,23 +1,20 @@
 import streamlit as st
-import pickle
-import os
-from datetime import datetime
-
-PICKLE_PATH = os.path.join(os.getcwd(), "bets.pkl")
-
-# Load existing bets
-def load_bets():
-    if os.path.exists(PICKLE_PATH):
-        with open(PICKLE_PATH, "rb") as f:
-            return pickle.load(f)
-    return {"ungraded_bets": [], "graded_bets": []}
-
-# Save updated bets
-def save_bets(bets):
-    with open(PICKLE_PATH, "wb") as f:
-        pickle.dump(bets, f)
+import pandas as pd
+from datetime import datetime, timedelta
+from bet_ledger import add_bet, parse_odds, grade_bets, get_bets, query_bets, distinct_values
+from bet_analytics import DIMENSION_LABELS, summary, aggregate_frame, graded_frame, breakdown
+from bet_grader import auto_grade
+from statcast_store import load_statcast, data_version
+from pitcher_games import build_pitcher_games
+from data_cache import cache, HOUR
+from instrumentation import start_run, finish_run, render_timings, span, count
+
+HISTORY_PAGE_SIZE = 25
+HISTORY_COLUMNS = ['date', 'player', 'prop_type', 'direction', 'line', 'odds', 'stake', 'grade', 'profit', 'timestamp']
+GRID_COLUMNS = ['id', 'date', 'player', 'prop_type', 'direction', 'line', 'odds', 'stake', 'grade']
 
 # --- Page Title ---
+run = start_run('bet_form')
 st.title("📊 MLB Prop Bet Tracker")
 
 # --- Add Bet Form ---
@@ -35,97 +32,152 @@ with st.expander("➕ Add a New Bet"):
 
         submitted = st.form_submit_button("Add Bet")
 
-        if submitted:
+        if submitted and parse_odds(odds)[0] is None:
+            st.error(f"Could not read odds \"{odds}\"; enter American odds such as -110 or +130.")
+        elif submitted:
             bet = {
                 "date": date.strftime("%Y-%m-%d"),
                 "player": player,
                 "prop_type": prop_type,
                 "line": prop_line,
                 "direction": direction.lower(),
-                "odds": odds,
+                "odds": odds.strip(),
                 "stake": stake,
                 "grade": grade if grade else None,
                 "timestamp": datetime.now().isoformat()
             }
 
-            bets = load_bets()
-            if grade == '' or not grade:
-                bets['ungraded_bets'].append(bet)
-            else:
-                bets['graded_bets'].append(bet)
-            save_bets(bets)
+            with span('add_bet'):
+                add_bet(bet)
             st.success("✅ Bet added successfully!")
             st.rerun()
 
 # --- Grade Ungraded Bets ---
+# Sections below are fragments: editing the grid, paging or filtering reruns only that
+# section, and a full rerun happens only after something is written to the ledger
 st.header("📝 Grade Ungraded Bets")
 
-bets = load_bets()
-ungraded_bets = bets.get("ungraded_bets", [])
-
-if ungraded_bets:
-    for i, bet in enumerate(ungraded_bets):
-        with st.expander(f"{bet['date']} - {bet['player']} - {bet['prop_type']} ({bet['direction'].capitalize()})"):
-            st.markdown(f"""
-            - **Line:** {bet['line']}  
-            - **Odds:** {bet['odds']}  
-            - **Stake:** ${bet['stake']}  
-            - **Timestamp:** {bet['timestamp']}
-            """)
-            grade_choice = st.selectbox(
-                f"Grade for bet {i+1}", ["", "W", "L", "P"], key=f"grade_select_{i}"
-            )
-            if grade_choice:
-                if st.button(f"✅ Submit Grade for Bet {i+1}", key=f"submit_grade_{i}"):
-                    # Move bet from ungraded to graded
-                    bet["grade"] = grade_choice
-                    bets['graded_bets'].append(bet)
-                    bets['ungraded_bets'].pop(i)
-                    save_bets(bets)
-                    st.success(f"Bet graded as {grade_choice}")
-                    st.rerun()
-else:
-    st.info("No ungraded bets currently available.")
-
-# --- Calculate Total Profit ---
-def calculate_profit(bet):
-    if bet["grade"] == "L":
-        return -bet["stake"]
-    elif bet["grade"] == "P":
-        return 0
-    elif bet["grade"] == "W":
-        odds_str = bet["odds"].replace("+", "")
-        try:
-            odds = int(odds_str)
-            if bet["odds"].startswith('+'):
-                return bet["stake"] * (odds / 100)
-            elif bet["odds"].startswith('-'):
-                return bet["stake"] * (100 / abs(odds))
-        except:
-            return 0  # Fallback for invalid odds format
-    return 0
-
-# Compute total profit
-total_profit = sum(calculate_profit(bet) for bet in bets.get("graded_bets", []))
-
-# Display profit
+
+def _pending_grades(key, ids):
+    # {bet id: grade} for a grid's edits; data_editor keeps them by row position, so they
+    # are mapped through the bet ids the grid was drawn with
+    edits = st.session_state.get(key, {}).get('edited_rows', {})
+    return {ids[int(pos)]: change['grade'] for pos, change in edits.items() if 'grade' in change and int(pos) < len(ids)}
+
+
+@st.fragment
+def grading_section():
+    with span('ungraded_bets'):
+        ungraded_bets = get_bets(graded=False)
+        count('rows_scanned', len(ungraded_bets))
+
+    if ungraded_bets:
+        # Grades everything Statcast already has results for; the rest stays in the grid below
+        first_date = min(bet['date'] for bet in ungraded_bets)
+        yesterday = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+        if first_date <= yesterday and st.button("🤖 Auto-grade from Statcast"):
+            with st.spinner("Grading from Statcast..."), span('auto_grade'):
+                with span('statcast'):
+                    statcast_df = cache.get_or_load(('statcast', first_date, yesterday), lambda: load_statcast(first_date, yesterday), ttl=6 * HOUR)
+                with span('pitcher_games'):
+                    pitcher_games = cache.get_or_load(('pitcher_games', data_version(statcast_df)), lambda: build_pitcher_games(statcast_df), ttl=6 * HOUR)
+                with span('grade'):
+                    auto_graded = auto_grade(statcast_df, pitcher_games)
+            st.success(f"Auto-graded {len(auto_graded)} of {len(ungraded_bets)} bet(s)")
+            st.rerun()
+
+        # One editable grid instead of an expander + selectbox + button per bet
+        grade_grid = pd.DataFrame(ungraded_bets, columns=GRID_COLUMNS).set_index('id')
+        ids = grade_grid.index.tolist()
+        grid_key = f"grade_grid_{st.session_state.get('grade_grid_rev', 0)}"
+        shown = st.session_state.get('grade_grid_ids')
+        if shown is not None and shown != ids:
+            # Another session graded or added a bet since the grid was drawn: carry this
+            # session's pending grades over by bet id and redraw the grid under a new key
+            carried = {**st.session_state.get('grade_grid_carried', {}), **_pending_grades(grid_key, shown)}
+            st.session_state['grade_grid_carried'] = {bet_id: grade for bet_id, grade in carried.items() if grade and bet_id in ids}
+            st.session_state.pop(grid_key, None)
+            st.session_state['grade_grid_rev'] = st.session_state.get('grade_grid_rev', 0) + 1
+            grid_key = f"grade_grid_{st.session_state['grade_grid_rev']}"
+        st.session_state['grade_grid_ids'] = ids
+        grade_grid['grade'] = grade_grid.index.map(st.session_state.get('grade_grid_carried', {})).fillna("")
+        edited = st.data_editor(
+            grade_grid,
+            column_config={
+                "grade": st.column_config.SelectboxColumn("Grade", options=["", "W", "L", "P"]),
+            },
+            disabled=GRID_COLUMNS[1:-1],
+            use_container_width=True,
+            key=grid_key,
+        )
+        new_grades = edited['grade'][edited['grade'].fillna("") != ""]
+        if st.button(f"✅ Submit {len(new_grades)} Grade(s)", disabled=new_grades.empty):
+            with span('grade_bets'):
+                grade_bets({int(bet_id): grade for bet_id, grade in new_grades.items()})
+            st.success(f"Graded {len(new_grades)} bet(s)")
+            st.rerun()
+    else:
+        st.info("No ungraded bets currently available.")
+
+
+grading_section()
+
+# --- To-Date Profit ---
+# Running totals are maintained by the ledger as bets are graded
+with span('summary'):
+    totals = summary()
+
 st.markdown("### 💰 To-Date Profit")
-st.metric(label="Profit", value=f"${total_profit:,.2f}")
+col1, col2, col3, col4 = st.columns(4)
+col1.metric(label="Profit", value=f"${totals['profit']:,.2f}")
+col2.metric(label="ROI", value=f"{totals['roi']:.1%}" if pd.notna(totals['roi']) else "-")
+col3.metric(label="Win Rate", value=f"{totals['win_rate']:.1%}" if pd.notna(totals['win_rate']) else "-")
+col4.metric(label="Units", value=f"{totals['units']:+.2f}")
+
+# --- P&L Breakdowns ---
+@st.fragment
+def breakdown_section():
+    dimension = st.selectbox("Break down by", list(DIMENSION_LABELS), format_func=DIMENSION_LABELS.get)
+    with span('breakdown'):
+        st.dataframe(aggregate_frame(dimension), use_container_width=True)
+
+        if st.checkbox("Prop Type x Direction"):
+            st.dataframe(breakdown(graded_frame(), ['prop_type', 'direction']), use_container_width=True)
+
+
+with st.expander("📈 Profit Breakdown"):
+    breakdown_section()
 
 # --- Graded Bet History (Toggleable) ---
-with st.expander("📚 Show Graded Bet History"):
-    graded_bets = bets.get("graded_bets", [])
-    if graded_bets:
-        for bet in sorted(graded_bets, key=lambda x: x['date'], reverse=True):
-            st.markdown(f"""
-            **{bet['date']} - {bet['player']}**  
-            - Prop: {bet['prop_type']} ({bet['direction'].capitalize()})  
-            - Line: {bet['line']}  
-            - Odds: {bet['odds']}  
-            - Stake: ${bet['stake']}  
-            - Grade: **{bet['grade']}**  
-            - Timestamp: {bet['timestamp']}  
-            ---
-            """)
+# Filters and paging run in SQL, so only the visible page is loaded and rendered
+@st.fragment
+def history_section():
+    col1, col2, col3, col4 = st.columns(4)
+    date_range = col1.date_input("Date Range", value=())
+    player_filter = col2.selectbox("Player", [""] + distinct_values('player'))
+    prop_filter = col3.selectbox("Prop Type", [""] + distinct_values('prop_type'))
+    grade_filter = col4.multiselect("Grade", ["W", "L", "P"])
+
+    start_date = date_range[0] if len(date_range) > 0 else None
+    end_date = date_range[1] if len(date_range) > 1 else start_date
+    filters = dict(graded=True, start=start_date, end=end_date, player=player_filter, prop_type=prop_filter, grades=grade_filter)
+    page = st.session_state.get("history_page", 1)
+    with span('history'):
+        page_bets, total = query_bets(**filters, limit=HISTORY_PAGE_SIZE, offset=(page - 1) * HISTORY_PAGE_SIZE)
+        pages = max((total - 1) // HISTORY_PAGE_SIZE + 1, 1)
+        if page > pages:
+            # Narrower filters can leave the remembered page past the end
+            page = st.session_state["history_page"] = pages
+            page_bets, total = query_bets(**filters, limit=HISTORY_PAGE_SIZE, offset=(page - 1) * HISTORY_PAGE_SIZE)
+        count('rows_scanned', len(page_bets))
+    if total:
+        st.dataframe(pd.DataFrame(page_bets, columns=HISTORY_COLUMNS), hide_index=True, use_container_width=True)
+        st.number_input(f"Page (of {pages}, {total} bets)", min_value=1, max_value=pages, key="history_page")
     else:
-        st.info("No graded bets yet.")
\ No newline at end of file
+        st.info("No graded bets yet.")
+
+
+with st.expander("📚 Show Graded Bet History"):
+    history_section()
+
+render_timings(finish_run(run))
@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+from opponent_splits import DEFAULT_RATES
+
+# Evaluates every pitcher prop on the slate at once: per-pitcher features come from one
+# groupby over the pitcher-game table, line-dependent hit rates from one props x games
+# merge, and each prop type's five rules are columnar comparisons.
+
+OPPONENT_ALIASES = {"A's": 'ATH', 'ARI': 'AZ', 'WAS': 'WSH'}
+
+BASE_COLUMNS = ['Pitcher', 'Team', 'Opponent', 'Prop', 'Line', 'Odds', 'Direction']
+
+# Display column -> feature column, per prop type
+METRIC_COLUMNS = {
+    'Strikeouts': {
+        'Season K/9': 'season_k9',
+        'Rolling K/9 (Last 3 Games)': 'rolling_k9',
+        'Opponent K%': 'opp_k_pct',
+        'Median Pitch Count (Last 3 Games)': 'median_pitch_count',
+        'Hit Rate': 'k_hit_rate',
+    },
+    'Pitching Outs': {
+        'Avg Outs/Start': 'season_outs_per_start',
+        'Rolling Outs/Start (Last 3 Games)': 'rolling_outs3',
+        'Avg Pitch Count (Last 3 Games)': 'median_pitch_count',
+        'Outs Hit Rate': 'outs_hit_rate',
+        'Opponent WHIP vs. Hand': 'opp_whip',
+    },
+    'Hits Allowed': {
+        'Season H/9': 'season_h9',
+        'Rolling H/9 (Last 3 Games)': 'rolling_h9',
+        'Opponent AVG vs. Hand': 'opp_avg',
+        'Median Hits Allowed (Last 3 Games)': 'median_hits_allowed',
+        'Hits Allowed Hit Rate': 'ha_hit_rate',
+    },
+    'Walks Allowed': {
+        'Season BB/9': 'season_bb9',
+        'Rolling BB/9 (Last 3 Games)': 'rolling_bb9',
+        'Opponent BB%': 'opp_bb_pct',
+        'Median Walks Allowed (Last 3 Games)': 'median_walks_L3',
+        'Walks Hit Rate': 'walks_hit_rate',
+    },
+}
+
+# Rounding applied to the displayed value of each feature
+ROUNDING = {
+    'Pitching Outs': {'season_outs_per_start': 2, 'rolling_outs3': 2, 'median_pitch_count': 1, 'outs_hit_rate': 2, 'opp_whip': 2},
+    'Hits Allowed': {'season_h9': 2, 'rolling_h9': 2, 'median_hits_allowed': 1, 'opp_avg': 3, 'ha_hit_rate': 2},
+    'Walks Allowed': {'season_bb9': 2, 'rolling_bb9': 2, 'opp_bb_pct': 3, 'walks_hit_rate': 2},
+}
+
+RESULT_COLUMNS = BASE_COLUMNS + [col for metrics in METRIC_COLUMNS.values() for col in metrics] + ['Rules Hit', 'Recommendation']
+
+
+def _per_nine(stat, outs):
+    innings_pitched = outs / 3
+    return (stat / innings_pitched * 9).where(innings_pitched > 0, 0.0)
+
+
+def pitcher_features(games):
+    # Line-independent features for every pitcher in `games`, one row per pitcher
+    games = games.sort_values(['pitcher', 'game_date', 'game_pk'], kind='stable')
+    by_pitcher = games.groupby('pitcher', sort=False)
+    recent = games[by_pitcher['game_date'].rank(method='dense', ascending=False) <= 3]
+
+    features = by_pitcher.agg(
+        p_throws=('p_throws', 'first'),
+        n_dates=('game_date', 'nunique'),
+        n_games=('game_pk', 'size'),
+        event_outs=('event_outs', 'sum'),
+        outs=('outs', 'sum'),
+        strikeouts=('strikeouts', 'sum'),
+        walks=('walks', 'sum'),
+        hits=('hits', 'sum'),
+    )
+    recent_totals = recent.groupby('pitcher').agg(
+        recent_event_outs=('event_outs', 'sum'),
+        recent_outs=('outs', 'sum'),
+        recent_strikeouts=('strikeouts', 'sum'),
+        recent_walks=('walks', 'sum'),
+        recent_hits=('hits', 'sum'),
+        median_pitch_count=('pitches', 'median'),
+    )
+    features = features.join(recent_totals)
+
+    # Medians over games with at least one hit / walk, as the per-pitcher evaluators counted them
+    features['median_hits_allowed'] = recent[recent['hits'] > 0].groupby('pitcher')['hits'].median()
+    walk_games = games[games['walks'] > 0].sort_values(['pitcher', 'game_pk'], kind='stable')
+    features['median_walks_L3'] = walk_games.groupby('pitcher').tail(3).groupby('pitcher')['walks'].median()
+    features[['median_hits_allowed', 'median_walks_L3']] = features[['median_hits_allowed', 'median_walks_L3']].fillna(0)
+
+    features['season_k9'] = _per_nine(features['strikeouts'], features['event_outs'])
+    features['rolling_k9'] = _per_nine(features['recent_strikeouts'], features['recent_event_outs'])
+    features['season_h9'] = _per_nine(features['hits'], features['outs'])
+    features['rolling_h9'] = _per_nine(features['recent_hits'], features['recent_outs'])
+    features['season_bb9'] = _per_nine(features['walks'], features['outs'])
+    features['rolling_bb9'] = _per_nine(features['recent_walks'], features['recent_outs'])
+    features['season_outs_per_start'] = features['outs'] / features['n_games']
+    features['rolling_outs3'] = features['recent_outs'] / 3
+    return features
+
+
+def _hit_rates(props, games):
+    # Games at or above each prop's line, counted for every prop in one merge
+    merged = props[['pitcher_id', 'line']].rename_axis('prop_row').reset_index().merge(
+        games[['pitcher', 'strikeouts', 'out_events', 'hits', 'walks']],
+        left_on='pitcher_id', right_on='pitcher'
+    )
+    line = merged['line']
+    merged['k_hit'] = (merged['strikeouts'] > 0) & (merged['strikeouts'] >= line)
+    merged['outs_hit'] = merged['out_events'] >= line
+    merged['hit_games'] = merged['hits'] > 0
+    merged['ha_hit'] = merged['hit_games'] & (merged['hits'] >= line)
+    merged['walks_hit'] = (merged['walks'] > 0) & (merged['walks'] >= line)
+    return merged.groupby('prop_row')[['k_hit', 'outs_hit', 'hit_games', 'ha_hit', 'walks_hit']].sum()
+
+
+def _opponent_lookup(props, opp_splits):
+    keys = pd.MultiIndex.from_arrays([props['opponent'], props['p_throws']])
+    rates = opp_splits[list(DEFAULT_RATES)].reindex(keys)
+    rates.index = props.index
+    return rates.fillna(DEFAULT_RATES)
+
+
+def _count(rules):
+    return np.sum(rules, axis=0)
+
+
+def _rules_hit(p):
+    over = p['direction'] == 'over'
+    line = p['line']
+    rules_hit = pd.Series(0, index=p.index)
+
+    k = p['type'] == 'Strikeouts'
+    k_over = _count([p['season_k9'] > 9.0, p['rolling_k9'] > 9.5, p['opp_k_pct'] > 0.24, p['median_pitch_count'] >= 85, p['k_hit_rate'] >= 0.65])
+    k_under = _count([p['season_k9'] < 8.0, p['rolling_k9'] < 8.0, p['opp_k_pct'] < 0.21, p['median_pitch_count'] < 80, p['k_hit_rate'] < 0.35])
+    rules_hit = rules_hit.mask(k, np.where(over, k_over, k_under))
+
+    po = p['type'] == 'Pitching Outs'
+    po_over = _count([p['season_outs_per_start'] > line, p['rolling_outs3'] > line, p['median_pitch_count'] >= 85, p['outs_hit_rate'] >= .65, p['opp_whip'] <= 1.11])
+    po_under = _count([p['season_outs_per_start'] < line, p['rolling_outs3'] < line, p['median_pitch_count'] <= 83, p['outs_hit_rate'] <= .35, p['opp_whip'] >= 1.35])
+    rules_hit = rules_hit.mask(po, np.where(over, po_over, po_under))
+
+    # Hits Allowed only switches to the under rules on an explicit 'under'
+    ha = p['type'] == 'Hits Allowed'
+    ha_over = _count([p['season_h9'] > 8.5, p['rolling_h9'] > 8.8, p['median_hits_allowed'] >= line, p['opp_avg'] >= 0.255, p['ha_hit_rate'] >= 0.65])
+    ha_under = _count([p['season_h9'] < 7.5, p['rolling_h9'] < 7.2, p['median_hits_allowed'] < line, p['opp_avg'] <= 0.24, p['ha_hit_rate'] <= 0.35])
+    rules_hit = rules_hit.mask(ha, np.where(p['direction'] == 'under', ha_under, ha_over))
+
+    bb = p['type'] == 'Walks Allowed'
+    bb_over = _count([p['season_bb9'] > 3.2, p['rolling_bb9'] > 3.6, p['median_walks_L3'] >= line, p['opp_bb_pct'] > 0.09, p['walks_hit_rate'] >= 0.65])
+    bb_under = _count([p['season_bb9'] < 2.2, p['rolling_bb9'] < 2.4, p['median_walks_L3'] < line, p['opp_bb_pct'] < 0.075, p['walks_hit_rate'] <= 0.35])
+    rules_hit = rules_hit.mask(bb, np.where(over, bb_over, bb_under))
+    return rules_hit.astype(int)
+
+
+def evaluate_slate(props, games, opp_splits):
+    # props: one row per selection with pitcher_name, opponent, label, line, odds, type,
+    # plus resolved pitcher_id and team. Rows that cannot be evaluated are dropped.
+    if props is None or props.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    props = props[props['pitcher_id'].notna()].copy()
+    props['pitcher_id'] = props['pitcher_id'].astype(int)
+    props['opponent'] = props['opponent'].replace(OPPONENT_ALIASES)
+    props['direction'] = props['label'].str.lower()
+
+    games = games[games['pitcher'].isin(props['pitcher_id'].unique())]
+    features = pitcher_features(games)
+    props = props.join(features, on='pitcher_id', how='inner')
+
+    # Strikeouts and Walks Allowed need at least three game dates
+    needs_history = props['type'].isin(['Strikeouts', 'Walks Allowed'])
+    props = props[~needs_history | (props['n_dates'] >= 3)]
+    if props.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    props = props.join(_opponent_lookup(props, opp_splits).rename(columns={
+        'k_pct': 'opp_k_pct', 'bb_pct': 'opp_bb_pct', 'whip': 'opp_whip', 'avg': 'opp_avg'
+    }))
+
+    hits = _hit_rates(props, games).reindex(props.index, fill_value=0)
+    props['k_hit_rate'] = hits['k_hit'] / props['n_games']
+    props['outs_hit_rate'] = hits['outs_hit'] / props['n_games']
+    props['ha_hit_rate'] = (hits['ha_hit'] / hits['hit_games']).where(hits['hit_games'] > 0, 0.0)
+    props['walks_hit_rate'] = hits['walks_hit'] / props['n_games']
+
+    rules_hit = _rules_hit(props)
+
+    results = pd.DataFrame({
+        'Pitcher': props['pitcher_name'],
+        'Team': props['team'],
+        'Opponent': props['opponent'],
+        'Prop': props['type'],
+        'Line': props['line'],
+        'Odds': props['odds'],
+        'Direction': props['label'],
+    })
+    for prop_type, metrics in METRIC_COLUMNS.items():
+        is_type = props['type'] == prop_type
+        rounding = ROUNDING.get(prop_type, {})
+        for display, feature in metrics.items():
+            values = props[feature].round(rounding[feature]) if feature in rounding else props[feature]
+            results[display] = values.where(is_type)
+    results['Rules Hit'] = rules_hit
+    results['Recommendation'] = np.where(rules_hit >= 4, 'Target', 'Pass')
+    return results[RESULT_COLUMNS].reset_index(drop=True)
@@ -0,0 +1,52 @@
+import pandas as pd
+
+# Known out-producing events and how many outs each records
+OUTS_MAP = {
+    'strikeout': 1, 'field_out': 1, 'force_out': 1, 'sac_bunt': 1, 'sac_fly': 1, 'double_play': 2,
+    'grounded_into_double_play': 2, 'strikeout_double_play': 2, 'sac_fly_double_play': 2, 'triple_play': 3,
+    'fielders_choice_out': 1
+}
+HIT_EVENTS = ['single', 'double', 'triple', 'home_run']
+
+
+def build_pitcher_games(df):
+    # One row per pitcher per game, aggregated from pitch rows in a single pass
+    df = df.sort_values(['pitcher', 'game_date', 'game_pk', 'at_bat_number', 'pitch_number'], kind='stable')
+    events = df['events'].astype(object)
+    group_keys = [df['pitcher'], df['game_pk']]
+
+    # Outs from pickoffs or caught stealings with a missing event label: the outs count
+    # went up after a pitch that ended no plate appearance. Shifting within the game means
+    # the first pitch of a start is never compared with the previous start.
+    prev_outs = df['outs_when_up'].groupby(group_keys).shift(1)
+    prev_events = events.groupby(group_keys).shift(1)
+    inferred_outs = (df['outs_when_up'] - prev_outs).where(prev_events.isna() & (df['outs_when_up'] > prev_outs), 0)
+
+    rows = pd.DataFrame({
+        'pitcher': df['pitcher'],
+        'game_pk': df['game_pk'],
+        'game_date': df['game_date'],
+        'p_throws': df['p_throws'].astype(object),
+        'strikeouts': events == 'strikeout',
+        'walks': events == 'walk',
+        'hits': events.isin(HIT_EVENTS),
+        'out_events': events.isin(OUTS_MAP),
+        'event_outs': events.map(OUTS_MAP).fillna(0),
+        'inferred_outs': inferred_outs.fillna(0),
+    })
+    games = rows.groupby(['pitcher', 'game_pk'], sort=False).agg(
+        game_date=('game_date', 'first'),
+        p_throws=('p_throws', 'first'),
+        pitches=('game_pk', 'size'),
+        strikeouts=('strikeouts', 'sum'),
+        walks=('walks', 'sum'),
+        hits=('hits', 'sum'),
+        out_events=('out_events', 'sum'),
+        event_outs=('event_outs', 'sum'),
+        inferred_outs=('inferred_outs', 'sum'),
+    ).reset_index()
+    games['event_outs'] = games['event_outs'].astype(int)
+    games['inferred_outs'] = games['inferred_outs'].astype(int)
+    games['outs'] = games['event_outs'] + games['inferred_outs']
+    return games
+
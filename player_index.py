@@ -0,0 +1,35 @@
+import numpy as np
+
+SORT_ORDER = ['game_date', 'at_bat_number', 'pitch_number']
+
+
+class PlayerIndex:
+    # The frame is sorted once by player, then game_date/at_bat_number/pitch_number,
+    # so each player's rows are one contiguous block addressed by (start, end) offsets.
+    def __init__(self, df, key, order=SORT_ORDER):
+        self.key = key
+        self.frame = df.sort_values([key] + list(order), kind='stable').reset_index(drop=True)
+        ids = self.frame[key].to_numpy()
+        if len(ids):
+            starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+            ends = np.r_[starts[1:], len(ids)]
+            self.offsets = dict(zip(ids[starts].tolist(), zip(starts.tolist(), ends.tolist())))
+        else:
+            self.offsets = {}
+
+    def __contains__(self, player_id):
+        return player_id is not None and int(player_id) in self.offsets
+
+    def get(self, player_id):
+        # Slice of the sorted frame; iloc on a contiguous range avoids a boolean scan and a copy
+        if player_id is None:
+            return self.frame.iloc[0:0]
+        start, end = self.offsets.get(int(player_id), (0, 0))
+        return self.frame.iloc[start:end]
+
+
+def build_indexes(df):
+    return {
+        'pitcher': PlayerIndex(df, 'pitcher'),
+        'batter': PlayerIndex(df, 'batter'),
+    }
@@ -0,0 +1,58 @@
+import pandas as pd
+from http_client import get_json, STATSAPI_BASE_URL
+from data_cache import cache, DAY
+
+# Team/position hydration for many players at once. The Stats API people endpoint takes
+# a comma-separated personIds list, so a slate costs a few requests instead of one per player.
+
+PEOPLE_URL = STATSAPI_BASE_URL + '/api/v1/people?personIds={ids}&hydrate=currentTeam'
+BATCH_SIZE = 50
+UNKNOWN_PROFILE = {'name': 'Unknown', 'team': 'Unknown', 'position': 'Unknown'}
+
+
+def _parse_person(player):
+    return {
+        'name': player.get('fullName'),
+        'team': player.get('currentTeam', {}).get('name', 'Unknown'),
+        'position': player.get('primaryPosition', {}).get('name', 'Unknown')
+    }
+
+
+def fetch_profiles(player_ids):
+    # Returns {mlbam_id: profile dict}; profiles are cached in-process for a day
+    ids = list(dict.fromkeys(int(pid) for pid in player_ids if pd.notna(pid)))
+
+    profiles = {}
+    missing = []
+    for pid in ids:
+        profile = cache.get(('player_profile', pid))
+        if profile is None:
+            missing.append(pid)
+        else:
+            profiles[pid] = profile
+
+    for start in range(0, len(missing), BATCH_SIZE):
+        batch = missing[start:start + BATCH_SIZE]
+        data = get_json(PEOPLE_URL.format(ids=','.join(str(pid) for pid in batch)), timeout=10) or {}
+        for player in data.get('people', []):
+            pid = player.get('id')
+            if pid is None:
+                continue
+            profiles[pid] = cache.set(('player_profile', pid), _parse_person(player), ttl=DAY)
+
+    for pid in ids:
+        profiles.setdefault(pid, dict(UNKNOWN_PROFILE))
+    return profiles
+
+
+def profile_frame(player_ids):
+    # Lookup frame (mlbam_id, name, team, position) for joining onto a props frame
+    profiles = fetch_profiles(player_ids)
+    return pd.DataFrame(
+        [{'mlbam_id': pid, **profile} for pid, profile in profiles.items()],
+        columns=['mlbam_id', 'name', 'team', 'position']
+    )
+
+
+def get_player_info(mlbam_id):
+    return fetch_profiles([mlbam_id])[int(mlbam_id)]
@@ -0,0 +1,103 @@
+import os
+import re
+import threading
+import unicodedata
+from difflib import SequenceMatcher
+from collections import defaultdict
+import pandas as pd
+
+# Name -> MLBAM ID resolution against the Chadwick register, loaded once per process.
+# Exact lookups go through a hash index on normalized "first last" names; misses fall
+# back to a trigram index so only a handful of candidates are string-compared.
+
+# A local register CSV (same columns as pybaseball's) replaces the download when set
+CHADWICK_REGISTER_PATH = os.environ.get('CHADWICK_REGISTER_PATH')
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+FUZZY_CUTOFF = 0.8
+
+
+def normalize_name(name):
+    # "Vladimir Guerrero Jr." -> "vladimir guerrero", "José Ramírez" -> "jose ramirez"
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"[.'’]", '', name)
+    name = re.sub(r'[^a-z]+', ' ', name)
+    return ' '.join(token for token in name.split() if token not in SUFFIXES)
+
+
+def _trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerResolver:
+    def __init__(self, register):
+        register = register[register['key_mlbam'] > 0].copy()
+        register['full_name'] = (register['name_first'].fillna('') + ' ' + register['name_last'].fillna('')).map(normalize_name)
+        # Most recent player first, so duplicate names (Sr./Jr.) resolve to the active one
+        register['played_last'] = register['mlb_played_last'].fillna(0)
+        register = register.sort_values('played_last', ascending=False, kind='stable')
+        register = register.drop_duplicates('full_name')
+
+        self.ids = dict(zip(register['full_name'], register['key_mlbam'].astype(int)))
+        self.trigram_index = defaultdict(list)
+        for full_name in self.ids:
+            for gram in _trigrams(full_name):
+                self.trigram_index[gram].append(full_name)
+        self.memo = {}
+        self._lock = threading.Lock()
+
+    def _fuzzy(self, key):
+        counts = defaultdict(int)
+        for gram in _trigrams(key):
+            for candidate in self.trigram_index.get(gram, ()):
+                counts[candidate] += 1
+        if not counts:
+            return None
+        shortlist = sorted(counts, key=counts.get, reverse=True)[:20]
+        best_score, best_name = max((SequenceMatcher(None, key, c).ratio(), c) for c in shortlist)
+        return self.ids[best_name] if best_score >= FUZZY_CUTOFF else None
+
+    def resolve(self, name):
+        if not name:
+            return None
+        with self._lock:
+            if name in self.memo:
+                return self.memo[name]
+        key = normalize_name(name)
+        player_id = self.ids.get(key)
+        if player_id is None:
+            player_id = self._fuzzy(key)
+        with self._lock:
+            self.memo[name] = player_id
+        return player_id
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver():
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            if CHADWICK_REGISTER_PATH:
+                register = pd.read_csv(CHADWICK_REGISTER_PATH)
+            else:
+                from pybaseball import chadwick_register
+                # save=True keeps a CSV copy in pybaseball's cache dir so restarts skip the download
+                register = chadwick_register(save=True)
+            _resolver = PlayerResolver(register)
+        return _resolver
+
+
+def resolve_player_id(name):
+    return get_resolver().resolve(name)
+
+
+def resolve_many(names):
+    # {name: mlbam_id or None}, each unique name resolved once; lookups are in-memory
+    # and CPU-bound, so a thread pool would only add overhead under the GIL
+    resolver = get_resolver()
+    return {name: resolver.resolve(name) for name in dict.fromkeys(names)}
@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timedelta
+import pandas as pd
+
+# Headless precompute of the daily recommendation tables. Runs the same pipelines as the
+# prop pages and writes each final_df to a parquet snapshot, stamped in the manifest with
+# the Statcast data version it was built from and when it was computed. The pages load
+# the latest snapshot instead of recomputing on every rerun.
+#
+#   python precompute.py                 # both tables, now
+#   python precompute.py --at 10:30      # every day at 10:30 until stopped
+
+SNAPSHOT_DIR = os.environ.get('SNAPSHOT_DIR', os.path.join(os.getcwd(), "snapshots"))
+MANIFEST_PATH = os.path.join(SNAPSHOT_DIR, "_manifest.json")
+
+TABLES = ['pitcher_plays', 'batter_plays']
+
+
+def _snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, f"{name}.parquet")
+
+
+def _load_manifest():
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    return {}
+
+
+def write_snapshot(name, final_df, version):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    tmp_path = _snapshot_path(name) + ".tmp"
+    final_df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, _snapshot_path(name))
+
+    manifest = _load_manifest()
+    manifest[name] = {
+        'data_version': version,
+        'computed_at': datetime.now().isoformat(timespec='seconds'),
+        'rows': len(final_df),
+    }
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+    return manifest[name]
+
+
+def snapshot_stamp(name):
+    # Cheap check for a newer snapshot: reads the manifest only
+    return _load_manifest().get(name)
+
+
+def load_snapshot(name):
+    # (final_df, stamp) for the latest snapshot of a table, or None if there is none yet
+    stamp = snapshot_stamp(name)
+    if stamp is None or not os.path.exists(_snapshot_path(name)):
+        return None
+    return pd.read_parquet(_snapshot_path(name)), stamp
+
+
+def compute(name):
+    # Runs one pipeline and snapshots its table; returns (final_df, stamp), or (None, None) without odds
+    from daily_plays import pitcher_plays, batter_plays
+
+    final_df, version = {'pitcher_plays': pitcher_plays, 'batter_plays': batter_plays}[name]()
+    if final_df is None:
+        print(f"{name}: no odds available, snapshot not updated")
+        return None, None
+    return final_df, write_snapshot(name, final_df, version)
+
+
+def run(tables=TABLES):
+    # One table failing (a payload shape change, a full disk) does not stop the others;
+    # returns the number of tables that failed
+    failed = 0
+    for name in tables:
+        start = time.perf_counter()
+        try:
+            final_df, stamp = compute(name)
+        except Exception as e:
+            print(f"{name}: precompute failed: {e!r}")
+            failed += 1
+            continue
+        if stamp is not None:
+            print(f"{name}: {stamp['rows']} rows, data version {stamp['data_version']}, {time.perf_counter() - start:.1f}s")
+    return failed
+
+
+def _next_run(at):
+    now = datetime.now()
+    hour, minute = (int(part) for part in at.split(':'))
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return target if target > now else target + timedelta(days=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the daily pitcher and batter recommendation tables")
+    parser.add_argument('--only', choices=TABLES, nargs='+', help="tables to compute (default: all)")
+    parser.add_argument('--at', help="run every day at this local time (HH:MM) instead of once now")
+    args = parser.parse_args(argv)
+    tables = args.only or TABLES
+
+    if not args.at:
+        return 1 if run(tables) else 0
+
+    from data_cache import cache
+    while True:
+        target = _next_run(args.at)
+        print(f"Next precompute at {target:%Y-%m-%d %H:%M}")
+        time.sleep(max(0.0, (target - datetime.now()).total_seconds()))
+        # Fresh odds each morning; Statcast tables keep their own TTLs and data versions
+        cache.invalidate(prefix='odds')
+        try:
+            run(tables)
+        except Exception as e:
+            # Anything outside a single table (the odds cache, stdout) still leaves tomorrow's run scheduled
+            print(f"Precompute run failed: {e!r}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import uuid
+import streamlit as st
+from data_cache import cache
+from precompute import load_snapshot, snapshot_stamp, compute
+from odds_poller import get_poller, POLL_INTERVAL
+from instrumentation import span
+
+# Shared layout of the pitcher and batter prop pages. The table is held in session
+# state and only reloaded when a newer snapshot appears or on "Recompute", and the
+# filters and tables live in a fragment, so filtering reruns just that fragment.
+# In live mode the fragment also reruns on the poll interval to pick up line moves.
+
+
+def session_table(name, noun):
+    # (final_df, stamp) for this session, or None when nothing could be computed
+    key = f"{name}_table"
+    held = st.session_state.get(key)
+    with span('snapshot'):
+        stamp = snapshot_stamp(name)
+    if st.sidebar.button("Recompute") or stamp is None:
+        cache.invalidate(prefix='odds')
+        with st.spinner(f"Evaluating {noun} props..."):
+            final_df, stamp = compute(name)
+        if final_df is None:
+            return None
+        held = st.session_state[key] = (final_df, stamp)
+    elif held is None or held[1] != stamp:
+        with span('snapshot'):
+            held = st.session_state[key] = load_snapshot(name)
+    return held
+
+
+def _session_id():
+    return st.session_state.setdefault('session_id', uuid.uuid4().hex)
+
+
+def live_toggle(name):
+    # The poller is shared by every session; this session only adds or removes itself
+    poller = get_poller(name)
+    live = st.sidebar.toggle("Live odds", key=f"{name}_live", help="Poll DraftKings in the background and re-evaluate only the selections that move")
+    if live:
+        poller.subscribe(_session_id())
+    else:
+        poller.unsubscribe(_session_id())
+    return live
+
+
+def _filter(final_df, name):
+    if final_df.empty:
+        return final_df
+    col1, col2, col3 = st.columns(3)
+    props = col1.multiselect("Prop", sorted(final_df['Prop'].unique()), key=f"{name}_prop_filter")
+    directions = col2.multiselect("Direction", sorted(final_df['Direction'].unique()), key=f"{name}_direction_filter")
+    min_rules = col3.slider("Min Rules Hit", 0, 5, 0, key=f"{name}_min_rules")
+    view = final_df[final_df['Rules Hit'] >= min_rules]
+    if props:
+        view = view[view['Prop'].isin(props)]
+    if directions:
+        view = view[view['Direction'].isin(directions)]
+    return view
+
+
+def results(name, final_df, stamp, live):
+    # Runs as a fragment: widget changes inside rerun only this function
+    live_state = None
+    if live:
+        poller = get_poller(name)
+        poller.subscribe(_session_id())
+        live_state = poller.state()
+    if live_state is not None and live_state['results'] is not None:
+        final_df = live_state['results']
+        stats = live_state['last_stats']
+        st.caption(f"Live odds as of {live_state['last_poll']:%H:%M:%S} ({live_state['polls']} polls): "
+                   f"{stats['evaluated']} re-evaluated, {stats['odds_moves']} repriced, {stats['removed']} removed")
+    else:
+        if live_state is not None:
+            st.info("Waiting for the first odds poll, showing the latest snapshot.")
+        st.caption(f"Computed {stamp['computed_at']} from Statcast data version {stamp['data_version']}")
+
+    with span('render'):
+        view = _filter(final_df, name)
+        st.dataframe(view, use_container_width=True)
+
+        if not view.empty:
+            st.subheader("Top Picks (5/5 Matching Rules)")
+            st.dataframe(view[view['Rules Hit'] == 5], use_container_width=True)
+
+        if not view.empty:
+            st.subheader("Top Picks (4/5 Matching Rules)")
+            st.dataframe(view[view['Rules Hit'] == 4], use_container_width=True)
+
+        if live_state is not None and not live_state['moves'].empty:
+            st.subheader("Line Moves")
+            st.dataframe(live_state['moves'], hide_index=True, use_container_width=True)
+
+
+def render(name, noun):
+    # Returns the session's table, or None when there is neither a snapshot nor odds
+    held = session_table(name, noun)
+    if held is None:
+        st.error(f"Could not fetch today's {noun} odds.")
+        return None
+    final_df, stamp = held
+    live = live_toggle(name)
+    st.fragment(results, run_every=POLL_INTERVAL if live else None)(name, final_df, stamp, live)
+    return final_df
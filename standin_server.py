@@ -0,0 +1,289 @@
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Local stand-ins for the DraftKings odds feed and the MLB Stats API people endpoint,
+# serving synthetic (or recorded) responses in the shapes the pages parse, with
+# configurable latency, error rate and 429 throttling. Typical offline session:
+#
+#   python standin_server.py --seed --latency-ms 150 --error-rate 0.05 --throttle-rps 3
+#   DRAFTKINGS_BASE_URL=http://127.0.0.1:8701 STATSAPI_BASE_URL=http://127.0.0.1:8702 \
+#   STATCAST_STORE_DIR=standin/statcast_store CHADWICK_REGISTER_PATH=standin/register.csv \
+#   streamlit run Home.py
+#
+# --seed also writes a synthetic Statcast store and player register for the season
+# window the pages load, so no request reaches Baseball Savant or GitHub either.
+
+STANDIN_DIR = os.path.join(os.getcwd(), "standin")
+SEASON_START = '2025-03-27'
+SEASON_END = '2025-05-07'
+
+# DraftKings subcategory id -> prop type, as requested by the pages
+DK_SUBCATEGORIES = {
+    '15221': 'Strikeouts',
+    '17413': 'Pitching Outs',
+    '9886': 'Hits Allowed',
+    '15219': 'Walks Allowed',
+    '6607': 'Total Bases',
+}
+PRICES = [-150, -140, -130, -120, -115, -110, 100, 105, 110, 120, 130]
+DK_PATH = re.compile(r'/subcategories/(\d+)$')
+PERSON_PATH = re.compile(r'/api/v1/people/(\d+)$')
+
+
+# ---------------------- Synthetic Fixtures ----------------------
+
+def synthetic_name(player_id):
+    # Letters only, since name normalization drops digits: 100302 -> "Baadac"
+    return ''.join(chr(ord('a') + int(d)) for d in str(player_id)).capitalize()
+
+
+def _american(odds):
+    # DraftKings writes negative prices with a unicode minus
+    return f"+{odds}" if odds > 0 else f"−{abs(odds)}"
+
+
+def _player_team(player_id, teams):
+    # synthetic_statcast ids encode the team: 100000/500000 + team index * 100 + slot
+    return teams[(player_id % 100000) // 100]
+
+
+def build_fixtures(df, slate_day, seed=0):
+    # DraftKings subcategory bodies and Stats API people for the games on slate_day
+    from synthetic_statcast import TEAMS
+    from backtest import day_context, LINE_GRID
+    from teams import mlb_team_abbreviations
+
+    rng = random.Random(seed)
+    team_names = {abbr: name for name, abbr in mlb_team_abbreviations.items()}
+    starters, batters = day_context(df[df['game_date'] == slate_day])
+
+    events = []
+    for _, game in starters.groupby('game_pk', sort=False):
+        events.append({'participants': [
+            {'name': team_names.get(row.team, row.team),
+             'metadata': {'shortName': row.team, 'startingPitcherPlayerName': f"Pitcher {synthetic_name(row.pitcher)}"}}
+            for row in game.itertuples()
+        ]})
+
+    def selections(player_ids, prop_type, prefix):
+        rows = []
+        for pid in player_ids:
+            line = rng.choice(LINE_GRID[prop_type])
+            over = rng.choice(PRICES)
+            for label, odds in (('Over', over), ('Under', -over)):
+                rows.append({
+                    'participants': [{'name': f"{prefix} {synthetic_name(pid)}"}],
+                    'label': label,
+                    'points': line,
+                    'displayOdds': {'american': _american(odds)},
+                })
+        return rows
+
+    draftkings = {}
+    for sub, prop_type in DK_SUBCATEGORIES.items():
+        if prop_type == 'Total Bases':
+            board = selections(batters['batter'].unique(), prop_type, 'Batter')
+        else:
+            board = selections(starters['pitcher'].unique(), prop_type, 'Pitcher')
+        draftkings[sub] = {'events': events, 'selections': board}
+
+    people = {}
+    for pid in set(df['pitcher'].unique()) | set(df['batter'].unique()):
+        pid = int(pid)
+        is_pitcher = pid < 500000
+        people[pid] = {
+            'id': pid,
+            'fullName': f"{'Pitcher' if is_pitcher else 'Batter'} {synthetic_name(pid)}",
+            'currentTeam': {'name': team_names.get(_player_team(pid, TEAMS), 'Unknown')},
+            'primaryPosition': {'name': 'Pitcher' if is_pitcher else 'Outfielder'},
+        }
+    return draftkings, people
+
+
+def register_frame(people):
+    import pandas as pd
+    return pd.DataFrame([
+        {'key_mlbam': pid, 'name_first': p['fullName'].split(' ')[0], 'name_last': p['fullName'].split(' ')[1], 'mlb_played_last': 2025}
+        for pid, p in people.items()
+    ])
+
+
+def seed(standin_dir, seed_value=0):
+    # The store location is read at import time, so point it at the stand-in dir first
+    os.environ['STATCAST_STORE_DIR'] = os.path.join(standin_dir, 'statcast_store')
+    import pandas as pd
+    from synthetic_statcast import make_statcast
+    from statcast_store import import_statcast
+
+    days = (pd.Timestamp(SEASON_END) - pd.Timestamp(SEASON_START)).days + 2
+    df = make_statcast(days=days, start_date=SEASON_START, seed=seed_value)
+    import_statcast(df[df['game_date'] <= SEASON_END], SEASON_START, SEASON_END)
+
+    # The day after the stored window is "today's" slate
+    slate_day = pd.Timestamp(SEASON_END) + pd.Timedelta(days=1)
+    draftkings, people = build_fixtures(df, slate_day, seed_value)
+    register_frame(people).to_csv(os.path.join(standin_dir, 'register.csv'), index=False)
+    with open(os.path.join(standin_dir, 'fixtures.json'), 'w') as f:
+        json.dump({'draftkings': draftkings, 'people': people}, f)
+    print(f"Seeded {len(df)} synthetic pitches, {len(people)} players and a {slate_day.date()} slate into {standin_dir}")
+
+
+def load_recorded(cache_dir):
+    # Responses recorded by http_client's disk cache, keyed by path + query
+    recorded = {}
+    for fname in os.listdir(cache_dir):
+        if not fname.endswith('.json'):
+            continue
+        with open(os.path.join(cache_dir, fname)) as f:
+            entry = json.load(f)
+        url = urlparse(entry['url'])
+        recorded[url.path + ('?' + url.query if url.query else '')] = entry['body']
+    return recorded
+
+
+# ---------------------- Servers ----------------------
+
+class Faults:
+    def __init__(self, latency_ms=0, jitter=0.3, error_rate=0.0, throttle_rps=0):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rps = throttle_rps
+        self.window = []
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, status):
+        with self._lock:
+            self.counts[status] = self.counts.get(status, 0) + 1
+
+    def check(self):
+        # Returns an error status to send instead of the real response, or None
+        if self.latency_ms:
+            time.sleep(max(0.0, random.gauss(self.latency_ms, self.latency_ms * self.jitter)) / 1000)
+        if self.throttle_rps:
+            with self._lock:
+                now = time.monotonic()
+                self.window = [t for t in self.window if now - t < 1.0]
+                if len(self.window) >= self.throttle_rps:
+                    return 429
+                self.window.append(now)
+        if random.random() < self.error_rate:
+            return 503
+        return None
+
+
+def make_handler(name, routes, faults, recorded):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body=None, headers=None):
+            payload = (body if isinstance(body, str) else json.dumps(body or {})).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+            faults.record(status)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/__stats':
+                return self._send(200, {'server': name, 'responses': faults.counts})
+
+            status = faults.check()
+            if status == 429:
+                return self._send(429, {'error': 'throttled'}, {'Retry-After': '1'})
+            if status is not None:
+                return self._send(status, {'error': 'injected failure'})
+
+            if self.path in recorded:
+                return self._send(200, recorded[self.path])
+            body = routes(url)
+            if body is None:
+                return self._send(404, {'error': f'no fixture for {self.path}'})
+            self._send(200, body)
+    return Handler
+
+
+def draftkings_routes(fixtures):
+    def route(url):
+        match = DK_PATH.search(url.path)
+        return fixtures['draftkings'].get(match.group(1)) if match else None
+    return route
+
+
+def statsapi_routes(fixtures):
+    people = {int(pid): person for pid, person in fixtures['people'].items()}
+
+    def route(url):
+        if url.path == '/api/v1/people':
+            ids = parse_qs(url.query).get('personIds', [''])[0].split(',')
+            return {'people': [people[int(pid)] for pid in ids if pid.isdigit() and int(pid) in people]}
+        match = PERSON_PATH.search(url.path)
+        if match and int(match.group(1)) in people:
+            return {'people': [people[int(match.group(1))]]}
+        return None
+    return route
+
+
+def serve(host, port, handler):
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in DraftKings and Stats API servers")
+    parser.add_argument('--dir', default=STANDIN_DIR, help="where fixtures, register and store live")
+    parser.add_argument('--seed', action='store_true', help="generate synthetic Statcast, register and fixtures first")
+    parser.add_argument('--seed-value', type=int, default=0)
+    parser.add_argument('--replay', help="http_cache directory of recorded responses to serve first")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--dk-port', type=int, default=8701)
+    parser.add_argument('--stats-port', type=int, default=8702)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests answered with a 503")
+    parser.add_argument('--throttle-rps', type=int, default=0, help="requests per second per server before 429s")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.dir, exist_ok=True)
+    if args.seed:
+        seed(args.dir, args.seed_value)
+    with open(os.path.join(args.dir, 'fixtures.json')) as f:
+        fixtures = json.load(f)
+    recorded = load_recorded(args.replay) if args.replay else {}
+
+    servers = [
+        serve(args.host, args.dk_port, make_handler('draftkings', draftkings_routes(fixtures),
+              Faults(args.latency_ms, error_rate=args.error_rate, throttle_rps=args.throttle_rps), recorded)),
+        serve(args.host, args.stats_port, make_handler('statsapi', statsapi_routes(fixtures),
+              Faults(args.latency_ms, error_rate=args.error_rate, throttle_rps=args.throttle_rps), recorded)),
+    ]
+    print("Stand-in servers running. Point the app at them with:")
+    print(f"  DRAFTKINGS_BASE_URL=http://{args.host}:{args.dk_port}")
+    print(f"  STATSAPI_BASE_URL=http://{args.host}:{args.stats_port}")
+    print(f"  STATCAST_STORE_DIR={os.path.join(args.dir, 'statcast_store')}")
+    print(f"  CHADWICK_REGISTER_PATH={os.path.join(args.dir, 'register.csv')}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import os
+import json
+import threading
+from datetime import date, datetime, timedelta
+import pandas as pd
+
+# Local pitch-level store: one parquet file per game_date under STORE_DIR.
+# Settled days that were fetched but had no games are recorded in the manifest
+# so they are never requested again, along with each stored day's full in-memory size.
+STORE_DIR = os.environ.get('STATCAST_STORE_DIR', os.path.join(os.getcwd(), "statcast_store"))
+MANIFEST_PATH = os.path.join(STORE_DIR, "_manifest.json")
+
+_store_lock = threading.Lock()
+
+# Savant posts late games and corrections for a day or two, so recent days are
+# refetched on every refresh and only older days can be recorded as having no games
+SETTLE_DAYS = 2
+
+# Columns the prop evaluators actually read; everything else stays on disk
+STATCAST_COLUMNS = [
+    'pitcher', 'batter', 'game_pk', 'game_date', 'events', 'outs_when_up',
+    'p_throws', 'stand', 'inning_topbot', 'home_team', 'away_team',
+    'at_bat_number', 'pitch_number', 'bb_type',
+    'estimated_ba_using_speedangle', 'estimated_slg_using_speedangle',
+    'estimated_woba_using_speedangle',
+]
+
+CATEGORY_COLUMNS = ['events', 'p_throws', 'stand', 'inning_topbot', 'home_team', 'away_team', 'bb_type']
+INT_COLUMNS = {
+    'pitcher': 'int32', 'batter': 'int32', 'game_pk': 'int32',
+    'outs_when_up': 'int8', 'at_bat_number': 'int16', 'pitch_number': 'int16',
+}
+
+
+def _to_date(d):
+    if isinstance(d, datetime):
+        return d.date()
+    if isinstance(d, date):
+        return d
+    return datetime.strptime(str(d), '%Y-%m-%d').date()
+
+
+def _partition_path(day):
+    return os.path.join(STORE_DIR, f"{day.isoformat()}.parquet")
+
+
+def _load_manifest():
+    # (empty dates, {date: MB of the day's full-column frame})
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+        return set(manifest.get('empty_dates', [])), manifest.get('sizes_mb', {})
+    return set(), {}
+
+
+def _save_manifest(empty_dates, sizes_mb):
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({'empty_dates': sorted(empty_dates), 'sizes_mb': dict(sorted(sizes_mb.items()))}, f)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def stored_dates():
+    if not os.path.isdir(STORE_DIR):
+        return []
+    days = []
+    for fname in os.listdir(STORE_DIR):
+        if fname.endswith('.parquet'):
+            try:
+                days.append(_to_date(fname[:-len('.parquet')]))
+            except ValueError:
+                continue
+    return sorted(days)
+
+
+def _settled(day):
+    return day < date.today() - timedelta(days=SETTLE_DAYS)
+
+
+def _missing_ranges(start, end):
+    empty_dates, _ = _load_manifest()
+    have = {day for day in set(stored_dates()) | {_to_date(d) for d in empty_dates} if _settled(day)}
+    ranges = []
+    day = start
+    while day <= end:
+        if day not in have:
+            range_start = day
+            while day + timedelta(days=1) <= end and day + timedelta(days=1) not in have:
+                day += timedelta(days=1)
+            ranges.append((range_start, day))
+        day += timedelta(days=1)
+    return ranges
+
+
+def _write_partitions(df, range_start, range_end):
+    empty_dates, sizes_mb = _load_manifest()
+    game_dates = pd.to_datetime(df['game_date']).dt.date if not df.empty else pd.Series(dtype=object)
+    day = range_start
+    while day <= range_end:
+        day_df = df[game_dates == day] if not df.empty else df
+        if day_df.empty:
+            # An empty unsettled day may just not be posted yet; leave it to be fetched again
+            if _settled(day):
+                empty_dates.add(day.isoformat())
+        else:
+            empty_dates.discard(day.isoformat())
+            sizes_mb[day.isoformat()] = round(frame_size_mb(day_df), 3)
+            tmp_path = _partition_path(day) + ".tmp"
+            day_df.reset_index(drop=True).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, _partition_path(day))
+        day += timedelta(days=1)
+    _save_manifest(empty_dates, sizes_mb)
+
+
+def refresh_store(start, end=None):
+    # Only completed days are stored; today's games are still in progress
+    start = _to_date(start)
+    end = _to_date(end) if end else date.today() - timedelta(days=1)
+    end = min(end, date.today() - timedelta(days=1))
+    if end < start:
+        return 0
+
+    # pybaseball takes about a second to import, so only pay for it when fetching
+    from pybaseball import statcast
+
+    os.makedirs(STORE_DIR, exist_ok=True)
+    fetched_days = 0
+    with _store_lock:
+        for range_start, range_end in _missing_ranges(start, end):
+            print(f"Fetching Statcast data {range_start} to {range_end}")
+            try:
+                df = statcast(range_start.isoformat(), range_end.isoformat())
+            except Exception as e:
+                print(f"Failed to fetch Statcast data for {range_start} to {range_end}: {e}")
+                continue
+            if df is None:
+                continue
+            _write_partitions(df, range_start, range_end)
+            fetched_days += (range_end - range_start).days + 1
+    return fetched_days
+
+
+def import_statcast(df, start, end):
+    # Writes a frame from elsewhere (e.g. synthetic data) into the store for [start, end]
+    start, end = _to_date(start), _to_date(end)
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with _store_lock:
+        _write_partitions(df, start, end)
+
+
+def read_store(start, end, columns=None):
+    # Partition pruning: only files whose game_date falls in [start, end] are opened
+    start, end = _to_date(start), _to_date(end)
+    frames = [pd.read_parquet(_partition_path(day), columns=columns) for day in stored_dates() if start <= day <= end]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def frame_size_mb(df):
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def stored_size_mb(start, end):
+    # Full-column size of the stored days in [start, end], or None if a day predates size tracking
+    start, end = _to_date(start), _to_date(end)
+    _, sizes_mb = _load_manifest()
+    days = [day.isoformat() for day in stored_dates() if start <= day <= end]
+    if any(day not in sizes_mb for day in days):
+        return None
+    return sum(sizes_mb[day] for day in days)
+
+
+def compact_statcast(df):
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col, dtype in INT_COLUMNS.items():
+        if col in df.columns and df[col].notna().all():
+            df[col] = df[col].astype(dtype)
+    if 'game_date' in df.columns:
+        df['game_date'] = pd.to_datetime(df['game_date'])
+    return df
+
+
+def data_version(df):
+    # Content hash over every evaluated column, so a Savant correction to a stored pitch
+    # (events, outs, batted-ball estimates) changes the version just like a new pitch does.
+    # Row hashes are summed, so row order does not matter. Stamped on df.attrs at load time
+    # so it is computed once.
+    if 'data_version' in df.attrs:
+        return df.attrs['data_version']
+    if df.empty:
+        return 'empty'
+    content = df[[col for col in STATCAST_COLUMNS if col in df.columns]]
+    return f"{len(df)}-{int(pd.util.hash_pandas_object(content, index=False).sum()) & 0xFFFFFFFFFFFF:012x}"
+
+
+def load_statcast(start, end=None, columns=STATCAST_COLUMNS, compact=True):
+    refresh_store(start, end)
+    end = end or (date.today() - timedelta(days=1)).isoformat()
+    df = read_store(start, end, columns=columns)
+    if compact and not df.empty:
+        # Baseline is every column as fetched; days stored before sizes were tracked fall
+        # back to the projected frame before its dtypes are compacted
+        before, basis = stored_size_mb(start, end), "all columns"
+        if before is None:
+            before, basis = frame_size_mb(df), "projected"
+        df = compact_statcast(df)
+        print(f"Statcast frame: {len(df)} rows x {len(df.columns)} cols, {before:.1f} MB ({basis}) -> {frame_size_mb(df):.1f} MB")
+    df.attrs['data_version'] = data_version(df)
+    return df
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+from statcast_store import STATCAST_COLUMNS, compact_statcast
+
+# Synthetic pitch-level Statcast frames for offline benchmarks and stand-in servers.
+# Games are generated in bulk with numpy: every team-game draws a stream of plate
+# appearance outcomes, innings fall out of the running out count, and each plate
+# appearance is expanded into pitches with the outcome on the last one.
+
+TEAMS = ['AZ', 'ATL', 'BAL', 'BOS', 'CWS', 'CHC', 'CIN', 'CLE', 'COL', 'DET', 'HOU', 'KC', 'LAA', 'LAD', 'MIA',
+         'MIL', 'MIN', 'NYM', 'NYY', 'ATH', 'PHI', 'PIT', 'SD', 'SF', 'SEA', 'STL', 'TB', 'TEX', 'TOR', 'WSH']
+
+# Plate appearance outcomes, their rough league frequencies and the outs each records
+EVENTS = ['strikeout', 'field_out', 'single', 'walk', 'double', 'home_run', 'force_out',
+          'grounded_into_double_play', 'hit_by_pitch', 'triple', 'sac_fly', 'fielders_choice_out']
+EVENT_PROBS = [.225, .40, .14, .085, .045, .03, .02, .02, .01, .005, .01, .01]
+EVENT_OUTS = {'strikeout': 1, 'field_out': 1, 'force_out': 1, 'grounded_into_double_play': 2, 'sac_fly': 1, 'fielders_choice_out': 1}
+NO_CONTACT = {'strikeout', 'walk', 'hit_by_pitch'}
+
+MAX_PAS = 60  # per team-game; enough to record 27 outs
+STARTER_INNINGS = 6
+
+
+def make_statcast(days=30, teams=30, starters_per_team=5, relievers_per_team=8, batters_per_team=13,
+                  pitches_per_pa=3.9, start_date='2025-03-27', seed=0, compact=True):
+    rng = np.random.default_rng(seed)
+    teams = TEAMS[:teams]
+    n_teams = len(teams)
+    staff = starters_per_team + relievers_per_team
+
+    # Player ids: pitchers 100000 + team * 100 + k, batters 500000 + team * 100 + k
+    pitcher_hand = rng.choice(np.array(['R', 'L']), size=(n_teams, staff), p=[.7, .3])
+    batter_stand = rng.choice(np.array(['R', 'L']), size=(n_teams, batters_per_team), p=[.6, .4])
+
+    # Schedule: every day each team plays one game against a random opponent
+    games_per_day = n_teams // 2
+    order = np.argsort(rng.random((days, n_teams)), axis=1)
+    home = order[:, :games_per_day].ravel()
+    away = order[:, games_per_day:2 * games_per_day].ravel()
+    day = np.repeat(np.arange(days), games_per_day)
+    n_games = len(day)
+    game_pk = 700000 + np.arange(n_games)
+
+    # Team-games: half 0 is the away team batting (Top), half 1 the home team (Bot)
+    tg_game = np.repeat(np.arange(n_games), 2)
+    tg_half = np.tile([0, 1], n_games)
+    tg_bat = np.where(tg_half == 0, away[tg_game], home[tg_game])
+    tg_field = np.where(tg_half == 0, home[tg_game], away[tg_game])
+
+    # Plate appearance streams, truncated once 27 outs are recorded
+    events = rng.choice(len(EVENTS), size=(len(tg_game), MAX_PAS), p=EVENT_PROBS)
+    outs = np.vectorize(lambda e: EVENT_OUTS.get(EVENTS[e], 0))(events)
+    outs_before = np.cumsum(outs, axis=1) - outs
+    keep = outs_before < 27
+    inning = np.minimum(outs_before // 3, 8) + 1
+    outs_when_up = outs_before % 3
+    lineup_slot = np.broadcast_to(np.arange(MAX_PAS) % 9, events.shape)
+
+    tg_idx, pa_idx = np.nonzero(keep)
+    pa_event = events[tg_idx, pa_idx]
+    pa_inning = inning[tg_idx, pa_idx]
+    pa_game = tg_game[tg_idx]
+    pa_half = tg_half[tg_idx]
+    pa_bat = tg_bat[tg_idx]
+    pa_field = tg_field[tg_idx]
+
+    # Each team-game uses nine of the team's batters; starters rotate by day, relievers by inning
+    lineups = np.argsort(rng.random((len(tg_game), batters_per_team)), axis=1)[:, :9]
+    pa_batter_slot = lineups[tg_idx, lineup_slot[tg_idx, pa_idx]]
+    starter_slot = (day[pa_game] + pa_field) % starters_per_team
+    reliever_slot = starters_per_team + (pa_inning - STARTER_INNINGS - 1 + pa_game) % relievers_per_team
+    pa_pitcher_slot = np.where(pa_inning <= STARTER_INNINGS, starter_slot, reliever_slot)
+
+    # at_bat_number runs through the game in inning / half order
+    pa = pd.DataFrame({
+        'game': pa_game, 'inning': pa_inning, 'half': pa_half, 'pa': pa_idx,
+    })
+    pa['at_bat_number'] = (
+        pa.sort_values(['game', 'inning', 'half', 'pa']).groupby('game').cumcount().reindex(pa.index) + 1
+    )
+
+    # Expand plate appearances into pitches; only the last pitch carries the outcome
+    n_pitches = np.clip(rng.poisson(pitches_per_pa - 1, size=len(pa)) + 1, 1, 12)
+    rows = np.repeat(np.arange(len(pa)), n_pitches)
+    pitch_number = np.arange(len(rows)) - np.repeat(np.cumsum(n_pitches) - n_pitches, n_pitches) + 1
+    last = pitch_number == n_pitches[rows]
+
+    event_names = np.array(EVENTS, dtype=object)[pa_event[rows]]
+    contact = last & ~np.isin(event_names, list(NO_CONTACT))
+    ground = np.isin(event_names, ['field_out', 'single', 'force_out', 'grounded_into_double_play', 'fielders_choice_out'])
+    est_ba = rng.random(len(rows)) * .6
+    est_slg = est_ba + rng.random(len(rows)) * .6
+
+    bat_team = pa_bat[rows]
+    field_team = pa_field[rows]
+    df = pd.DataFrame({
+        'pitcher': 100000 + field_team * 100 + pa_pitcher_slot[rows],
+        'batter': 500000 + bat_team * 100 + pa_batter_slot[rows],
+        'game_pk': game_pk[pa_game[rows]],
+        'game_date': pd.Timestamp(start_date) + pd.to_timedelta(day[pa_game[rows]], unit='D'),
+        'events': np.where(last, event_names, None),
+        'outs_when_up': outs_when_up[tg_idx, pa_idx][rows],
+        'p_throws': pitcher_hand[field_team, pa_pitcher_slot[rows]],
+        'stand': batter_stand[bat_team, pa_batter_slot[rows]],
+        'inning_topbot': np.where(pa_half[rows] == 0, 'Top', 'Bot'),
+        'home_team': np.array(teams, dtype=object)[home[pa_game[rows]]],
+        'away_team': np.array(teams, dtype=object)[away[pa_game[rows]]],
+        'at_bat_number': pa['at_bat_number'].to_numpy()[rows],
+        'pitch_number': pitch_number,
+        'bb_type': np.where(contact, np.where(ground, 'ground_ball', 'fly_ball'), None),
+        'estimated_ba_using_speedangle': np.where(contact, est_ba, np.nan),
+        'estimated_slg_using_speedangle': np.where(contact, est_slg, np.nan),
+        'estimated_woba_using_speedangle': np.where(contact, est_ba * 1.2, np.nan),
+    })[STATCAST_COLUMNS]
+
+    # Statcast returns rows newest first, not in game order
+    df = df.iloc[::-1].reset_index(drop=True)
+    return compact_statcast(df) if compact else df
+
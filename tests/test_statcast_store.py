@@ -0,0 +1,15 @@
+from synthetic_statcast import make_statcast
+from statcast_store import data_version
+
+
+def test_corrected_event_changes_version():
+    df = make_statcast(days=2, teams=2)
+    corrected = df.copy()
+    row = corrected.index[corrected['events'].notna()][0]
+    corrected.loc[row, 'events'] = 'home_run' if corrected.loc[row, 'events'] != 'home_run' else 'single'
+    assert data_version(corrected) != data_version(df)
+
+
+def test_version_ignores_row_order():
+    df = make_statcast(days=2, teams=2)
+    assert data_version(df.iloc[::-1]) == data_version(df)
@@ -0,0 +1,138 @@
+import time
+import threading
+from datetime import datetime, date
+from instrumentation import start_run, finish_run, span
+
+# Background warm-up started from Home.py after a server restart: fills the Statcast
+# store and the data cache, loads the player register, fetches today's odds and makes
+# sure both recommendation tables have a snapshot for today's data. Each step runs
+# inside a 'warmup' timing run, so the log also records how long a cold start took.
+# Heavy modules are imported inside the steps, not at module import.
+
+WARMUP_BUDGET = 120  # seconds; Home.py flags a warm-up that runs longer
+
+STEPS = [
+    ('statcast', "Statcast store"),
+    ('derived', "Derived tables"),
+    ('register', "Player register"),
+    ('odds', "Today's odds"),
+    ('tables', "Recommendation tables"),
+]
+TABLES = ['pitcher_plays', 'batter_plays']
+
+
+def _statcast():
+    from daily_plays import season_statcast
+    season_statcast()
+
+
+def _derived():
+    from daily_plays import season_statcast, pitcher_tables, batter_indexes
+    statcast_df = season_statcast()
+    pitcher_tables(statcast_df)
+    batter_indexes(statcast_df)
+
+
+def _register():
+    from player_resolver import get_resolver
+    get_resolver()
+
+
+def _odds():
+    from draftkings_odds import pitcher_lines_today, batter_lines_today
+    pitcher_lines_today()
+    batter_lines_today()
+
+
+def _stale(stamp, version):
+    return stamp is None or stamp['data_version'] != version or stamp['computed_at'][:10] != date.today().isoformat()
+
+
+class Warmup:
+    def __init__(self):
+        self.steps = {name: {'label': label, 'status': 'pending', 'seconds': None, 'error': None} for name, label in STEPS}
+        self.started = None
+        self.started_at = None
+        self.finished = None
+        self.first_table = None  # seconds from start until a table was ready to show
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _mark_table(self):
+        with self._lock:
+            if self.first_table is None:
+                self.first_table = time.perf_counter() - self.started
+
+    def _tables(self):
+        from precompute import snapshot_stamp, compute
+        from statcast_store import data_version
+        from daily_plays import season_statcast
+
+        # A snapshot from an earlier run can be shown right away, even while it is refreshed
+        if any(snapshot_stamp(name) is not None for name in TABLES):
+            self._mark_table()
+        version = data_version(season_statcast())
+        for name in TABLES:
+            if _stale(snapshot_stamp(name), version):
+                final_df, _ = compute(name)
+                if final_df is None:
+                    raise RuntimeError(f"no odds for {name}")
+            self._mark_table()
+
+    def _step(self, name, fn):
+        with self._lock:
+            self.steps[name]['status'] = 'running'
+        start = time.perf_counter()
+        try:
+            with span(name):
+                fn()
+            status, error = 'done', None
+        except Exception as e:
+            print(f"Warm-up step {name} failed: {e}")
+            status, error = 'failed', str(e)
+        with self._lock:
+            self.steps[name].update(status=status, seconds=round(time.perf_counter() - start, 2), error=error)
+
+    def _run(self):
+        run = start_run('warmup')
+        steps = {'statcast': _statcast, 'derived': _derived, 'register': _register, 'odds': _odds, 'tables': self._tables}
+        for name, _ in STEPS:
+            self._step(name, steps[name])
+        finish_run(run)
+        with self._lock:
+            self.finished = time.perf_counter()
+
+    def start(self):
+        # Idempotent: the first caller in the process starts the warm-up, later callers just watch it
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.started = time.perf_counter()
+            self.started_at = datetime.now()
+            self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self._thread.start()
+
+    def state(self):
+        with self._lock:
+            elapsed = None
+            if self.started is not None:
+                elapsed = (self.finished or time.perf_counter()) - self.started
+            return {
+                'steps': [dict(step, name=name) for name, step in self.steps.items()],
+                'started_at': self.started_at,
+                'elapsed': elapsed,
+                'first_table': self.first_table,
+                'done': self.finished is not None,
+            }
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def get_warmup():
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = Warmup()
+        return _warmup